@@ -84,11 +84,12 @@ KAFKA CONSUMER BASICS:
        value = json.loads(msg.value().decode('utf-8'))
        # Validate and save to DB
 
-4. **Commit Offset (Manual)**
-   consumer.commit(asynchronous=False)
-   - Tells Kafka: "I've processed this message"
+4. **Commit Offset (Manual, Batched)**
+   consumer.commit(offsets=[...], asynchronous=True)
+   - Tells Kafka: "I've processed everything up to here"
    - enable.auto.commit=False for manual control
    - Commit after successful DB write (at-least-once)
+   - Batched every N messages / T seconds, flushed on revoke and shutdown
 
 5. **Error Handling**
    if msg.error():
@@ -120,5 +121,6 @@ Pattern 3: Batch commit (higher throughput)
 - Commit offset of last message
 - Trade-off: More duplicates on crash
 
-This service uses Pattern 2 (manual commit per message) with idempotency.
+This service uses Pattern 3 (batch commit every commit_batch_size messages or
+commit_interval_s seconds) with idempotency absorbing redelivered duplicates.
 """
@@ -7,6 +7,7 @@ Loads settings from environment variables with Pydantic validation.
 
 import socket
 import uuid
+from functools import lru_cache
 
 from dotenv import load_dotenv
 from pydantic import Field
@@ -21,6 +22,13 @@ class ConsumerConfig(BaseSettings):
     Consumer service configuration with validation.
 
     Includes Kafka consumer settings and PostgreSQL database configuration.
+
+    WHY KEEP PYDANTIC (NOT A PLAIN DATACLASS)?
+    - Settings are parsed and validated once (load_config() is cached), so
+      the BaseSettings cost is paid once per process, not per message
+    - Range checks (ge/le) give clear errors for bad environment values
+    - The consumer copies the few hot-path values into plain attributes
+    - frozen=True gives the read-only, hashable behaviour of a frozen dataclass
     """
 
     # === KAFKA CONSUMER SETTINGS ===
@@ -54,6 +62,42 @@ class ConsumerConfig(BaseSettings):
         description="Auto-commit offsets (False = manual commit)",
     )
 
+    # === FETCH TUNING (librdkafka prefetch) ===
+    fetch_min_bytes: int = Field(
+        default=65536,
+        ge=1,
+        le=104857600,
+        description="Broker waits for this many bytes before answering a fetch",
+    )
+
+    fetch_wait_max_ms: int = Field(
+        default=100,
+        ge=0,
+        le=10000,
+        description="Max time the broker waits to fill fetch_min_bytes (latency vs batch size)",
+    )
+
+    max_partition_fetch_bytes: int = Field(
+        default=1048576,
+        ge=1024,
+        le=104857600,
+        description="Max bytes per partition per fetch response",
+    )
+
+    queued_max_messages_kbytes: int = Field(
+        default=65536,
+        ge=1,
+        le=2097151,
+        description="Max KB prefetched into the local consumer queue",
+    )
+
+    queued_min_messages: int = Field(
+        default=100000,
+        ge=1,
+        le=10000000,
+        description="Min messages per partition librdkafka tries to keep prefetched",
+    )
+
     # === DATABASE SETTINGS ===
     postgres_host: str = Field(
         default="localhost",
@@ -87,6 +131,47 @@ class ConsumerConfig(BaseSettings):
         description="SQLAlchemy connection pool size",
     )
 
+    db_max_overflow: int = Field(
+        default=2,
+        ge=0,
+        le=20,
+        description=(
+            "Extra connections beyond db_pool_size under load "
+            "(consumer concurrency: 1 writer thread + health checks)"
+        ),
+    )
+
+    db_pool_timeout: float = Field(
+        default=10.0,
+        gt=0,
+        le=60,
+        description="Seconds to wait for a pooled connection before failing",
+    )
+
+    db_pool_use_lifo: bool = Field(
+        default=True,
+        description=(
+            "Reuse the most recently returned pooled connection (LIFO) so "
+            "surplus connections sit idle and can time out server-side"
+        ),
+    )
+
+    db_use_pgbouncer: bool = Field(
+        default=False,
+        description=(
+            "Connect through PgBouncer (transaction pooling): use NullPool "
+            "and disable server-side prepared statements"
+        ),
+    )
+
+    db_use_copy: bool = Field(
+        default=True,
+        description=(
+            "Bulk-load each batch with COPY into a staging table "
+            "(False = multi-row INSERT ... ON CONFLICT)"
+        ),
+    )
+
     # === PROCESSING SETTINGS ===
     max_retries: int = Field(
         default=3,
@@ -102,6 +187,35 @@ class ConsumerConfig(BaseSettings):
         description="Retry backoff in milliseconds",
     )
 
+    retry_backoff_max_ms: int = Field(
+        default=30000,
+        ge=100,
+        le=60000,
+        description="Upper bound for a single (exponential, jittered) retry backoff",
+    )
+
+    consume_batch_size: int = Field(
+        default=500,
+        ge=1,
+        le=10000,
+        description="Max messages fetched per consume() call",
+    )
+
+    # === OFFSET COMMIT SETTINGS ===
+    commit_batch_size: int = Field(
+        default=500,
+        ge=1,
+        le=100000,
+        description="Commit offsets after this many processed messages",
+    )
+
+    commit_interval_s: float = Field(
+        default=5.0,
+        gt=0,
+        le=300,
+        description="Max seconds between offset commits (bounds redelivery on crash)",
+    )
+
     # === LOGGING ===
     log_level: str = Field(
         default="INFO",
@@ -120,6 +234,9 @@ class ConsumerConfig(BaseSettings):
         env_file_encoding = "utf-8"
         case_sensitive = False
         extra = "ignore"
+        # Read-only for the process lifetime: assignment raises ValidationError,
+        # and the model becomes hashable. Use model_copy(update=...) to override.
+        frozen = True
 
     def get_kafka_config(self) -> dict:
         """
@@ -128,6 +245,15 @@ class ConsumerConfig(BaseSettings):
         Generates a unique client ID by appending hostname and UUID suffix.
         This enables horizontal scaling with multiple consumer instances.
 
+        FETCH TUNING:
+        - librdkafka prefetches on its background thread; larger fetches
+          amortize the network round trip over many messages
+        - fetch.wait.max.ms trades latency (and so commit latency) against
+          fetch batch size: the broker answers after fetch.min.bytes OR
+          fetch.wait.max.ms, whichever comes first
+        - socket.nagle.disable: don't delay small requests (commits, heartbeats)
+        - statistics.interval.ms=0: no stats JSON emitted/parsed
+
         HORIZONTAL SCALING:
         - Multiple consumers with same group.id share partitions
         - Each consumer needs unique client.id for partition assignment
@@ -147,16 +273,39 @@ class ConsumerConfig(BaseSettings):
             "client.id": unique_client_id,
             "auto.offset.reset": self.consumer_auto_offset_reset,
             "enable.auto.commit": self.enable_auto_commit,
+            # Don't emit _PARTITION_EOF pseudo-errors each time we catch up
+            "enable.partition.eof": False,
+            # Throughput tuning (see FETCH TUNING above)
+            "fetch.min.bytes": self.fetch_min_bytes,
+            "fetch.wait.max.ms": self.fetch_wait_max_ms,
+            "max.partition.fetch.bytes": self.max_partition_fetch_bytes,
+            "queued.max.messages.kbytes": self.queued_max_messages_kbytes,
+            "queued.min.messages": self.queued_min_messages,
+            "socket.nagle.disable": True,
+            "statistics.interval.ms": 0,
         }
 
     def get_database_url(self) -> str:
-        """Get SQLAlchemy database URL."""
+        """
+        Get SQLAlchemy database URL.
+
+        Uses the psycopg (v3) driver: server-side parameter binding and
+        automatic prepared statements for the repeated batch INSERT.
+        """
         return (
-            f"postgresql://{self.postgres_user}:{self.postgres_password}"
+            f"postgresql+psycopg://{self.postgres_user}:{self.postgres_password}"
             f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
         )
 
 
+@lru_cache(maxsize=1)
 def load_config() -> ConsumerConfig:
-    """Load and validate consumer configuration."""
+    """
+    Load and validate consumer configuration.
+
+    The result is cached: building a BaseSettings model re-reads the .env
+    file and re-runs every validator, and the environment does not change
+    during the process lifetime. Call load_config.cache_clear() to force a
+    reload (e.g. in tests after monkeypatching environment variables).
+    """
     return ConsumerConfig()
@@ -10,11 +10,11 @@ KAFKA CONSUMER ARCHITECTURE:
 ├─────────────────────────────────────────────────────────────────────────┤
 │  1. Subscribe to topic → Join consumer group                            │
 │  2. Kafka assigns partitions (rebalancing)                              │
-│  3. Poll for messages (blocking with timeout)                           │
-│  4. Deserialize message (JSON bytes → Python dict)                      │
-│  5. Validate message data                                               │
-│  6. Process message (save to database)                                  │
-│  7. Commit offset (tell Kafka: message processed)                       │
+│  3. Consume messages in batches (blocking with timeout)                 │
+│  4. Decode + validate message in one pass (msgspec, JSON → Struct)      │
+│  5. Skip invalid messages (poison pills)                                │
+│  6. Buffer row, then bulk INSERT the batch (one DB round-trip)          │
+│  7. Commit offsets in batches (tell Kafka: messages processed)          │
 │  8. Handle errors (retry transient, skip permanent)                     │
 │  9. Graceful shutdown (close consumer, commit offsets)                  │
 └─────────────────────────────────────────────────────────────────────────┘
@@ -22,9 +22,27 @@ KAFKA CONSUMER ARCHITECTURE:
 AT-LEAST-ONCE DELIVERY:
 - Consumer commits offset AFTER successful database write
 - If crash before commit → message redelivered
-- Idempotency via order_id PRIMARY KEY (duplicates cause IntegrityError)
+- Idempotency via PRIMARY KEY (order_id, created_at) + INSERT ... ON CONFLICT DO NOTHING
 - Trade-off: Duplicate processing vs lost messages
 
+BATCHED WRITES AND OFFSET COMMITS:
+- A session + INSERT + COMMIT per message is one DB round-trip per order,
+  and a synchronous offset commit per message is one more to Kafka
+- Instead, validated orders are buffered as plain dicts and written with a
+  single executemany INSERT ... ON CONFLICT DO NOTHING per batch
+- Only after the batch is durable do we commit the highest offset per
+  partition (asynchronously) - "process then commit" still holds
+- A batch is flushed every commit_batch_size messages or commit_interval_s,
+  and synchronously on rebalance (on_revoke) and on shutdown
+- On a crash, at most one batch is redelivered (idempotency absorbs it)
+
+PIPELINED WRITES:
+- The batch INSERT runs on a single background writer thread
+- While batch N is being written, the poll loop consumes and validates
+  batch N+1, so Kafka fetch latency and DB latency overlap
+- At most one batch is in flight; batch N's offsets are committed (from
+  the main thread) before batch N+1 is submitted
+
 CONSUMER GROUP BEHAVIOR:
 - Consumer group: 'order-processors'
 - Multiple consumers → share partitions (horizontal scaling)
@@ -35,23 +53,136 @@ CONSUMER GROUP BEHAVIOR:
 
 ERROR HANDLING STRATEGY:
 1. Validation errors: Log and skip (can't recover, poison message)
-2. Transient DB errors: Retry with exponential backoff
+2. Transient DB errors: Retry with capped, jittered exponential backoff
 3. Fatal errors: Log, alert, shutdown gracefully
-4. Duplicates: Log and skip (already processed, idempotency working)
+4. Duplicates: Ignored by ON CONFLICT DO NOTHING (idempotency working)
+5. DB retries exhausted: Stop WITHOUT committing (batch is redelivered)
+6. Row rejected by the DB (constraint/data error): Split the batch, skip
+   only the bad row (retrying the same batch would fail forever)
 """
 
-import json
 import logging
+import random
 import time
-from typing import Any, Dict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Annotated, Any, NamedTuple, cast
 
-from confluent_kafka import Consumer, KafkaError, Message
-from sqlalchemy.exc import IntegrityError, OperationalError
+import msgspec
+import orjson
+from confluent_kafka import Consumer, KafkaError, KafkaException, Message, TopicPartition
+from sqlalchemy.exc import DataError, IntegrityError, OperationalError
 
 from src.consumer.config import ConsumerConfig
 from src.consumer.database import DatabaseManager
-from src.consumer.models import Order
-from src.shared.logger import CorrelationAdapter
+from src.consumer.models import Order, amount_to_cents
+from src.shared.logger import ContextCorrelationAdapter, correlation_id_var
+
+# ==============================================================================
+# MESSAGE SCHEMA
+# ==============================================================================
+# msgspec decodes AND validates a message in a single C-level pass: JSON
+# parsing, required fields, types and constraints are all checked while the
+# bytes are read, with no intermediate dict for the happy path.
+#
+# The limits mirror the orders table, so a message that decodes also fits
+# the row: a too-long string or out-of-range amount is rejected here as a
+# poison message, instead of failing the whole batch INSERT later.
+
+# total_amount is stored as BIGINT cents (amount_to_cents), which must be
+# > 0 (check_positive_amount) and < 2**63. For floats, amount_to_cents(x)
+# >= 1 exactly when x > 0.005 (0.005 itself rounds half-even to 0), and
+# every float below 2**63 / 100 converts to fewer than 2**63 cents.
+_MIN_AMOUNT_EXCLUSIVE = 0.005
+_MAX_AMOUNT_EXCLUSIVE = 2**63 / 100
+
+# BIGINT upper bound (exclusive), checked again on the converted cents
+_MAX_CENTS = 2**63
+
+
+class OrderMessage(msgspec.Struct):
+    """
+    Order message as published by the producer (value of a Kafka record).
+
+    Field names match the orders table columns, so a decoded message maps
+    1:1 onto a row. Unknown fields are ignored (forward compatible).
+
+    VALIDATION (enforced by the decoder):
+    - All fields required
+    - Strings: at most as long as their VARCHAR column
+    - items: non-empty JSON array of objects
+    - total_amount: JSON number (strings and booleans rejected) that
+      converts to 0 < cents < 2**63
+    - created_at: RFC 3339 timestamp ("Z" or "+00:00" suffix)
+    """
+
+    order_id: Annotated[str, msgspec.Meta(max_length=50)]
+    customer_id: Annotated[str, msgspec.Meta(max_length=50)]
+    customer_name: Annotated[str, msgspec.Meta(max_length=100)]
+    customer_email: Annotated[str, msgspec.Meta(max_length=100)]
+    items: Annotated[list[dict[str, Any]], msgspec.Meta(min_length=1)]
+    total_amount: Annotated[float, msgspec.Meta(gt=_MIN_AMOUNT_EXCLUSIVE, lt=_MAX_AMOUNT_EXCLUSIVE)]
+    status: Annotated[str, msgspec.Meta(max_length=20)]
+    created_at: datetime
+
+
+# Built once: a typed decoder caches its schema, so decode() does no setup
+_decode_order = msgspec.json.Decoder(OrderMessage).decode
+
+
+def _order_row(order: OrderMessage) -> dict[str, Any]:
+    """
+    Convert a decoded message to a column dict for the batched INSERT.
+
+    Money is stored as BIGINT cents, converted with the same
+    amount_to_cents() as Order.row_from_kafka_message(), so the COPY path
+    and the ORM path always agree on total_amount_cents.
+
+    Raises:
+        ValueError: If the amount converts to cents outside (0, 2**63).
+            The decoder's total_amount bounds already rule this out; the
+            check keeps a bad amount a bad message, not a DB error.
+    """
+    cents = amount_to_cents(order.total_amount)
+    if not 0 < cents < _MAX_CENTS:
+        raise ValueError(f"total_amount {order.total_amount!r} is {cents} cents")
+    return {
+        "order_id": order.order_id,
+        "customer_id": order.customer_id,
+        "customer_name": order.customer_name,
+        "customer_email": order.customer_email,
+        "items": order.items,
+        "total_amount_cents": cents,
+        "status": order.status,
+        "created_at": order.created_at,
+    }
+
+
+# Error codes that stop the consumer (checked in _handle_kafka_error)
+_FATAL_KAFKA_ERRORS = frozenset(
+    (
+        KafkaError._ALL_BROKERS_DOWN,
+        KafkaError._AUTHENTICATION,
+        KafkaError.TOPIC_AUTHORIZATION_FAILED,
+    )
+)
+
+
+class _WriteResult(NamedTuple):
+    """Outcome of writing one batch (see _write_batch_with_retry)."""
+
+    inserted: int  # Rows actually inserted
+    rejected: int  # Bad rows skipped (constraint / data errors)
+
+
+class _InflightBatch(NamedTuple):
+    """A batch handed to the writer thread, waiting to be committed."""
+
+    future: Future  # Resolves to a _WriteResult
+    size: int  # Rows in the batch
+    offsets: dict[tuple[str, int], int]  # Offsets to commit once durable
+    started_ns: int  # monotonic_ns() at submit, for flush_time_ms
+
 
 # ==============================================================================
 # KAFKA CONSUMER
@@ -75,6 +206,7 @@ class OrderConsumer:
         consumer: Confluent Kafka consumer instance
         db_manager: Database connection manager
         logger: Structured logger
+        log: Logger adapter adding the current order's correlation_id
         running: Flag for graceful shutdown
         messages_processed: Counter for metrics
         messages_failed: Counter for errors
@@ -97,6 +229,21 @@ class OrderConsumer:
         self.config = config
         self.db_manager = db_manager
         self.logger = logging.getLogger(__name__)
+        # Shared adapter: adds the current order's correlation_id (set per
+        # message via correlation_id_var) without a per-message allocation
+        self.log = ContextCorrelationAdapter(self.logger, {})
+
+        # Hot-path settings copied to plain attributes once: the config is
+        # immutable for the process lifetime, and this skips pydantic's
+        # attribute machinery on every message / batch
+        self._topic = config.kafka_topic_orders
+        self._max_retries = config.max_retries
+        self._retry_backoff_ms = config.retry_backoff_ms
+        self._retry_backoff_max_ms = config.retry_backoff_max_ms
+        self._commit_batch_size = config.commit_batch_size
+        self._use_copy = config.db_use_copy
+        self._consume_batch_size = config.consume_batch_size
+        self._commit_interval_s = config.commit_interval_s
 
         # Metrics counters
         self.messages_processed = 0
@@ -104,16 +251,31 @@ class OrderConsumer:
         self.messages_skipped = 0  # Duplicates
         self.running = True
 
+        # Write batching: orders waiting for the next bulk INSERT, and the
+        # highest handled offset (+1) per (topic, partition) to commit after it
+        self._pending_orders: list[OrderMessage] = []
+        self._pending_offsets: dict[tuple[str, int], int] = {}
+        self._uncommitted_count = 0
+        self._last_commit_ts = time.monotonic()
+
+        # Single writer thread: batch N is inserted while batch N+1 is consumed
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="order-db-writer")
+        self._inflight: _InflightBatch | None = None
+
         # Create Kafka consumer
         self.consumer = self._create_consumer()
 
-        # Subscribe to topic
-        self.consumer.subscribe([config.kafka_topic_orders])
+        # Subscribe to topic (revoke callback flushes offsets before rebalance)
+        self.consumer.subscribe(
+            [self._topic],
+            on_assign=self._on_assign,
+            on_revoke=self._on_revoke,
+        )
 
         self.logger.info(
             "Order consumer initialized",
             extra={
-                "topic": config.kafka_topic_orders,
+                "topic": self._topic,
                 "group_id": config.consumer_group_id,
                 "bootstrap_servers": config.kafka_bootstrap_servers,
             },
@@ -147,35 +309,65 @@ class OrderConsumer:
         Start consuming messages from Kafka.
 
         This is the main consumer loop:
-        1. Poll for message
-        2. Process message
-        3. Commit offset
+        1. Fetch a batch of messages
+        2. Validate and buffer message
+        3. Flush batch to DB, then commit offsets
+           (every commit_batch_size messages or commit_interval_s)
         4. Repeat until shutdown
 
         CONSUMER LOOP:
         - Runs continuously until self.running = False
-        - Polls with 1-second timeout (non-blocking)
+        - consume() fetches up to consume_batch_size messages per call:
+          one Python → librdkafka crossing per batch instead of per message
+        - 1-second timeout (returns early when the batch is full)
         - Handles errors without crashing
         - Logs metrics periodically
+        - Creates next month's orders partition ahead of time (hourly check)
         """
         self.logger.info("Starting consumer loop...")
 
+        # Open the pool's connections before the first batch arrives, and
+        # make sure this and next month's orders partitions exist
+        self.db_manager.warmup()
+        self.db_manager.ensure_partitions()
+
+        # Bind hot-path callables to locals once: every self.x / obj.method
+        # lookup inside the loop is otherwise a dict lookup per iteration
+        consume = self.consumer.consume
+        process = self._process_message
+        handle_error = self._handle_kafka_error
+        maybe_flush = self._maybe_flush
+        log_pool_status = self.db_manager.log_pool_status
+        ensure_partitions = self.db_manager.ensure_partitions
+        batch_size = self._consume_batch_size
+
         try:
             while self.running:
-                # Poll for message (1-second timeout)
-                msg = self.consumer.poll(timeout=1.0)
+                # Fetch up to consume_batch_size messages in one call
+                # (1-second timeout; empty list if nothing arrived)
+                msgs = consume(num_messages=batch_size, timeout=1.0)
 
-                if msg is None:
-                    # No message available, continue polling
-                    continue
+                # Handle the whole fetched list, even if stop() was called
+                # meanwhile - it is already in memory, so drain it into the batch
+                for msg in msgs:
+                    error = msg.error()
+                    if error is not None:
+                        # Handle Kafka errors
+                        handle_error(error)
+                        continue
 
-                if msg.error():
-                    # Handle Kafka errors
-                    self._handle_kafka_error(msg.error())
-                    continue
+                    # Buffer message for the next batch write
+                    process(msg)
 
-                # Process message
-                self._process_message(msg)
+                # Write + commit if a batch is due (also on idle polls,
+                # so the interval is honoured when traffic stops)
+                maybe_flush()
+
+                # Periodic pool utilization log (self-throttled to 1/minute)
+                log_pool_status()
+
+                # Next month's partition before the month starts (self-throttled to 1/hour)
+                ensure_partitions()
 
         except KeyboardInterrupt:
             self.logger.info("Received keyboard interrupt, shutting down...")
@@ -193,245 +385,385 @@ class OrderConsumer:
             msg: Kafka message
 
         PROCESSING FLOW:
-        1. Deserialize JSON
-        2. Extract order_id for correlation
-        3. Validate data structure
-        4. Create Order instance
-        5. Save to database (with retry)
-        6. Commit offset
-        7. Log success
+        1. Decode + validate in one pass (msgspec → OrderMessage)
+        2. Set order_id for log correlation
+        3. Buffer order for the next batched INSERT
+           (row dicts are built later, on the writer thread)
+        4. Mark offset as pending commit
 
         ERROR HANDLING:
-        - JSON decode error → skip (poison message)
         - Validation error → skip (bad data)
-        - Integrity error → skip (duplicate)
-        - Operational error → retry (transient)
+        - JSON decode error → skip (poison message)
         - Unknown error → log and skip
+        - Duplicates and DB errors are handled per batch in _flush_batch()
         """
-        start_time = time.time()
-        order_id = None
+        # Logging is decided once per message; when DEBUG is filtered out we
+        # skip the clock read and the extras dict entirely.
+        # (isEnabledFor is cached by the logging module, so this is cheap.)
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        start_ns = time.monotonic_ns() if debug_enabled else 0
+        token = None
 
         try:
-            # 1. Deserialize message
-            message_data = self._deserialize_message(msg)
-            order_id = message_data.get("order_id", "unknown")
-
-            # Set up correlation logger for this order
-            order_logger = CorrelationAdapter(self.logger, {"correlation_id": order_id})
-
-            order_logger.debug(
-                "Processing message",
-                extra={
-                    "partition": msg.partition(),
-                    "offset": msg.offset(),
-                    "customer_id": message_data.get("customer_id"),
-                },
-            )
-
-            # 2. Validate message structure
-            self._validate_message(message_data)
-
-            # 3. Create Order instance from message
-            order = Order.from_kafka_message(message_data)
-
-            # Extract data for logging before session closes
-            customer_id = message_data["customer_id"]
-            total_amount = message_data["total_amount"]
-
-            # 4. Save to database with retry
-            self._save_order_with_retry(order, order_logger)
-
-            # 5. Commit offset (message successfully processed)
-            self.consumer.commit(asynchronous=False)
-
-            # 6. Update metrics
-            self.messages_processed += 1
-            processing_time = (time.time() - start_time) * 1000  # milliseconds
-
-            order_logger.info(
-                "Order processed successfully",
-                extra={
-                    "customer_id": customer_id,
-                    "total_amount": total_amount,
-                    "processing_time_ms": round(processing_time, 2),
-                    "messages_processed": self.messages_processed,
-                },
-            )
+            # 1. Decode and validate message (raises on any schema violation;
+            # a null value decodes as b"" and takes the DecodeError path)
+            order = _decode_order(msg.value() or b"")
+
+            # 2. All self.log calls below carry this order's correlation_id
+            token = correlation_id_var.set(order.order_id)
+
+            # 3. Buffer order for the batched INSERT
+            self._pending_orders.append(order)
+
+            # 4. Mark offset for the commit that follows the batch write
+            self._mark_processed(msg)
+
+            if debug_enabled:
+                self.log.debug(
+                    "Order buffered for batch insert",
+                    extra={
+                        "partition": msg.partition(),
+                        "offset": msg.offset(),
+                        "customer_id": order.customer_id,
+                        "processing_time_ms": (time.monotonic_ns() - start_ns) / 1_000_000,
+                        "batch_size": len(self._pending_orders),
+                    },
+                )
 
-        except json.JSONDecodeError:
-            # Permanent error: Can't decode JSON
+        except msgspec.ValidationError as e:
+            # Permanent error: Valid JSON, invalid data structure
+            # (checked before DecodeError, which it subclasses)
             self.messages_failed += 1
             self.logger.error(
-                "Failed to decode JSON message",
+                "Message validation failed",
                 exc_info=True,
                 extra={
-                    "correlation_id": order_id,
+                    "correlation_id": self._peek_order_id(msg),
+                    "error": str(e),
                     "offset": msg.offset(),
                     "partition": msg.partition(),
                 },
             )
-            # Skip this message (don't commit offset in this case? No, commit to move on)
-            self.consumer.commit(asynchronous=False)
+            # Skip this message
+            self._mark_processed(msg)
 
-        except ValueError as e:
-            # Permanent error: Invalid data structure
+        except msgspec.DecodeError:
+            # Permanent error: Can't decode JSON
             self.messages_failed += 1
-            self.logger.error(
-                "Message validation failed",
+            self.log.error(
+                "Failed to decode JSON message",
                 exc_info=True,
-                extra={"correlation_id": order_id, "error": str(e)},
-            )
-            # Skip this message
-            self.consumer.commit(asynchronous=False)
-
-        except IntegrityError:
-            # Duplicate order (idempotency working as expected)
-            self.messages_skipped += 1
-            self.logger.warning(
-                "Duplicate order detected, skipping",
                 extra={
-                    "correlation_id": order_id,
-                    "messages_skipped": self.messages_skipped,
+                    "offset": msg.offset(),
+                    "partition": msg.partition(),
                 },
             )
-            # Commit offset (already processed)
-            self.consumer.commit(asynchronous=False)
+            # Skip this message (commit its offset to move on)
+            self._mark_processed(msg)
 
         except Exception:
             # Unknown error
             self.messages_failed += 1
-            self.logger.error(
-                "Unexpected error processing message",
-                exc_info=True,
-                extra={"correlation_id": order_id},
-            )
+            self.log.error("Unexpected error processing message", exc_info=True)
             # Commit offset to skip this message and move on
             # (otherwise consumer gets stuck retrying bad message forever)
-            try:
-                self.consumer.commit(asynchronous=False)
-            except Exception:
-                self.logger.error(
-                    "Failed to commit offset after error",
-                    exc_info=True,
-                    extra={"correlation_id": order_id},
-                )
+            self._mark_processed(msg)
+
+        finally:
+            if token is not None:
+                correlation_id_var.reset(token)
 
-    def _deserialize_message(self, msg: Message) -> Dict[str, Any]:
+    # ==========================================================================
+    # BATCHED WRITES + OFFSET COMMITS
+    # ==========================================================================
+
+    def _mark_processed(self, msg: Message) -> None:
         """
-        Deserialize Kafka message from bytes to Python dict.
+        Record a message's offset as ready to commit.
+
+        Kafka commits the offset of the NEXT message to read, hence +1.
+        Only the highest offset per partition matters, so a dict keyed by
+        (topic, partition) is all the state we need: any number of handled
+        messages collapses into one TopicPartition per partition per commit.
+
+        The max() guard keeps the entry monotonic even if a partition is
+        rewound (seek / redelivery), so a commit never moves backwards.
 
         Args:
-            msg: Kafka message
+            msg: Kafka message that has been fully handled
+        """
+        # topic/partition/offset are only None on error events, which never
+        # reach this point (see start())
+        key = cast(tuple[str, int], (msg.topic(), msg.partition()))
+        next_offset = cast(int, msg.offset()) + 1
+        if next_offset > self._pending_offsets.get(key, -1):
+            self._pending_offsets[key] = next_offset
+        self._uncommitted_count += 1
+
+    def _maybe_flush(self) -> None:
+        """
+        Flush the batch if the batch size or interval has been reached.
 
-        Returns:
-            Deserialized message data
+        Also completes an in-flight write that has already finished, so its
+        offsets are committed as soon as the rows are durable instead of
+        waiting for the next flush.
+        """
+        if self._inflight is not None and self._inflight.future.done():
+            self._complete_inflight(asynchronous=True)
+
+        if not self._pending_offsets:
+            return
+
+        if (
+            self._uncommitted_count >= self._commit_batch_size
+            or time.monotonic() - self._last_commit_ts >= self._commit_interval_s
+        ):
+            self._flush_batch(asynchronous=True)
+
+    def _flush_batch(self, asynchronous: bool) -> None:
+        """
+        Hand buffered orders to the writer thread; commit offsets once durable.
+
+        Args:
+            asynchronous: True on the hot path - submit the write and return
+                immediately (offsets are committed when it completes).
+                False on rebalance/shutdown - wait for every write and commit
+                offsets synchronously before returning.
 
         Raises:
-            json.JSONDecodeError: If message is not valid JSON
+            OperationalError: If a batch write exhausted its retries.
+                All uncommitted orders and offsets are dropped, so the caller
+                must stop consuming - they are redelivered on restart.
+
+        PIPELINING (one batch in flight):
+        - While batch N is being inserted on the writer thread, the main
+          thread keeps consuming, deserializing and validating batch N+1
+        - Before submitting batch N+1 we wait for batch N and commit its
+          offsets, so commits stay in order and never overtake the data
+
+        ORDERING GUARANTEE:
+        - Rows first, offsets second: an offset is never committed for a
+          row that is not yet durable (at-least-once preserved)
+        - Skipped poison messages share the same offset map, so they are
+          also committed only after earlier good rows are written
+        """
+        # Finish the previous write first (keeps offset commits in order)
+        if self._inflight is not None:
+            self._complete_inflight(asynchronous)
+
+        # Snapshot the current batch; the main thread starts a fresh one
+        orders, offsets = self._pending_orders, self._pending_offsets
+        self._pending_orders = []
+        self._pending_offsets = {}
+        self._uncommitted_count = 0
+        self._last_commit_ts = time.monotonic()
+
+        if not orders:
+            # Only skipped messages: nothing to write, commit straight away
+            self._commit_offsets(offsets, asynchronous)
+            return
+
+        self._inflight = _InflightBatch(
+            future=self._writer.submit(self._write_batch_with_retry, orders),
+            size=len(orders),
+            offsets=offsets,
+            started_ns=time.monotonic_ns(),
+        )
+
+        if not asynchronous:
+            self._complete_inflight(asynchronous=False)
+
+    def _complete_inflight(self, asynchronous: bool) -> None:
+        """
+        Wait for the in-flight batch write, record metrics, commit its offsets.
+
+        Args:
+            asynchronous: Offset commit mode (see _commit_offsets)
 
-        MESSAGE FORMAT:
-        - Key: customer_id (UTF-8 string)
-        - Value: JSON order data (UTF-8 encoded)
+        Raises:
+            OperationalError: If the write exhausted its retries (see _flush_batch)
         """
-        # Decode bytes to string, then parse JSON
-        message_bytes = msg.value()
-        message_str = message_bytes.decode("utf-8")
-        message_data = json.loads(message_str)
+        batch = self._inflight
+        if batch is None:
+            return
+        self._inflight = None
+
+        try:
+            inserted, rejected = batch.future.result()
+        except Exception:
+            # Forget everything uncommitted; it is redelivered after restart
+            self._pending_orders = []
+            self._pending_offsets = {}
+            self._uncommitted_count = 0
+            raise
+
+        duplicates = batch.size - inserted - rejected
+        self.messages_processed += inserted
+        self.messages_skipped += duplicates
+        self.messages_failed += rejected
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Order batch written",
+                extra={
+                    "batch_size": batch.size,
+                    "inserted": inserted,
+                    "duplicates_skipped": duplicates,
+                    "rejected": rejected,
+                    "flush_time_ms": round((time.monotonic_ns() - batch.started_ns) / 1_000_000, 2),
+                    "messages_processed": self.messages_processed,
+                },
+            )
 
-        return message_data
+        self._commit_offsets(batch.offsets, asynchronous)
 
-    def _validate_message(self, message_data: Dict[str, Any]) -> None:
+    def _write_batch_with_retry(self, orders: list[OrderMessage]) -> _WriteResult:
         """
-        Validate message structure.
+        Write a batch of orders, skipping rows the database rejects.
 
         Args:
-            message_data: Deserialized message data
+            orders: Decoded messages; converted to column dicts here, on the
+                writer thread, so the poll loop never pays for it
+
+        Returns:
+            Rows inserted (the rest were duplicates) and rows rejected
+            (by _order_row or by the database)
 
         Raises:
-            ValueError: If message structure is invalid
-
-        REQUIRED FIELDS:
-        - order_id: str
-        - customer_id: str
-        - customer_name: str
-        - customer_email: str
-        - items: list
-        - total_amount: float
-        - status: str
-        - created_at: str (ISO 8601)
-        """
-        required_fields = [
-            "order_id",
-            "customer_id",
-            "customer_name",
-            "customer_email",
-            "items",
-            "total_amount",
-            "status",
-            "created_at",
-        ]
+            OperationalError: If all retries exhausted
+
+        THREADING:
+        - Runs on the single writer thread (self._writer), not the poll loop
+        - The main thread keeps consuming while this sleeps, until the next
+          flush has to wait for it; librdkafka heartbeats from its own
+          thread, and the backoff cap keeps total retry time well below
+          max.poll.interval.ms (default 5 min)
+        """
+        rows = []
+        invalid = 0
+        for order in orders:
+            try:
+                rows.append(_order_row(order))
+            except ValueError as e:
+                # Bad message, not a DB error: skip it like a poison message
+                invalid += 1
+                self.logger.error(
+                    "Order failed row conversion, skipping it",
+                    extra={"correlation_id": order.order_id, "error": str(e)},
+                )
 
-        missing_fields = [field for field in required_fields if field not in message_data]
+        if not rows:
+            return _WriteResult(0, invalid)
+        inserted, rejected = self._write_rows(rows)
+        return _WriteResult(inserted, rejected + invalid)
 
-        if missing_fields:
-            raise ValueError(f"Missing required fields: {missing_fields}")
+    def _write_rows(self, rows: list[dict[str, Any]]) -> _WriteResult:
+        """
+        Insert rows as one transaction; on a bad row, split and recurse.
 
-        # Validate items is a non-empty list
-        if not isinstance(message_data["items"], list) or len(message_data["items"]) == 0:
-            raise ValueError("Items must be a non-empty list")
+        Args:
+            rows: Order column dicts (see _order_row)
 
-        # Validate total_amount is positive
-        if (
-            not isinstance(message_data["total_amount"], (int, float))
-            or message_data["total_amount"] <= 0
-        ):
-            raise ValueError("Total amount must be a positive number")
+        Returns:
+            Rows inserted and rows rejected
 
-    def _save_order_with_retry(self, order: Order, logger: CorrelationAdapter) -> None:
+        Raises:
+            OperationalError: If all retries exhausted
+
+        BAD ROWS (IntegrityError / DataError):
+        - Non-transient: one row breaking a constraint (or not fitting its
+          column) aborts the whole statement, and retrying the same batch
+          fails the same way - the consumer would stop, restart, receive
+          the same batch again and stop again, forever
+        - The batch is halved and each half written separately, down to
+          single rows; a single row that still fails is logged and skipped
+        - k bad rows in a batch of n cost O(k log n) extra transactions;
+          the good halves are committed as they go (a redelivery after a
+          later failure is absorbed by ON CONFLICT DO NOTHING)
+        - OrderMessage validation rejects the known cases at decode time,
+          so this is the safety net, not the common path
         """
-        Save order to database with retry logic.
+        try:
+            return _WriteResult(self._insert_with_retry(rows), 0)
+        except (IntegrityError, DataError) as e:
+            if len(rows) > 1:
+                mid = len(rows) // 2
+                first = self._write_rows(rows[:mid])
+                second = self._write_rows(rows[mid:])
+                return _WriteResult(
+                    first.inserted + second.inserted, first.rejected + second.rejected
+                )
+
+            self.logger.error(
+                "Order rejected by the database, skipping it",
+                exc_info=True,
+                extra={
+                    "correlation_id": rows[0]["order_id"],
+                    "error_type": type(e).__name__,
+                },
+            )
+            return _WriteResult(0, 1)
+
+    def _insert_with_retry(self, rows: list[dict[str, Any]]) -> int:
+        """
+        Bulk insert rows in one transaction, retrying transient errors.
 
         Args:
-            order: Order instance to save
-            logger: Correlation logger for this order
+            rows: Order column dicts (see _order_row)
+
+        Returns:
+            Number of rows actually inserted (the rest were duplicates)
 
         Raises:
             OperationalError: If all retries exhausted
-            IntegrityError: If duplicate order (idempotency)
+            IntegrityError, DataError: A row was rejected (not retried)
+
+        BULK LOAD (config.db_use_copy, default):
+        - DatabaseManager.bulk_copy_orders(): COPY the batch into a staging
+          table, then one INSERT ... SELECT ... ON CONFLICT DO NOTHING
+        - COPY streams rows with no per-row statement parsing
+
+        BULK INSERT (fallback):
+        - Order.insert_new(): one executemany of a prebuilt
+          INSERT ... ON CONFLICT (order_id, created_at) DO NOTHING RETURNING order_id
+        - Redelivered orders are a no-op instead of an IntegrityError that
+          aborts the whole batch
 
         RETRY STRATEGY:
         - Retry only transient errors (OperationalError)
-        - Don't retry permanent errors (IntegrityError, ValueError)
-        - Exponential backoff: 1s, 2s, 4s, ...
+        - The whole batch is retried (it is one transaction)
+        - Capped exponential backoff with full jitter:
+          sleep = uniform(0, min(retry_backoff_ms * 2^attempt, retry_backoff_max_ms))
+        - Jitter spreads retries of all consumer replicas over time, so
+          they don't hit a recovering database at the same instant
         - Max retries from config
         """
-        for attempt in range(self.config.max_retries):
+        for attempt in range(self._max_retries):
             try:
-                # Attempt to save order
-                with self.db_manager.get_session() as session:
-                    session.add(order)
-                    # Commit happens automatically on context exit
+                if self._use_copy:
+                    inserted = self.db_manager.bulk_copy_orders(rows)
+                else:
+                    with self.db_manager.get_session() as session:
+                        inserted = Order.insert_new(session, rows)
+                        # Commit happens automatically on context exit
 
                 # Success!
-                return
-
-            except IntegrityError:
-                # Duplicate order (primary key violation)
-                # This is expected (idempotency), re-raise to handle at higher level
-                raise
+                return inserted
 
             except OperationalError as e:
                 # Transient database error (connection lost, timeout, etc.)
-                if attempt < self.config.max_retries - 1:
-                    # Calculate backoff time (exponential)
-                    backoff_ms = self.config.retry_backoff_ms * (2**attempt)
-                    backoff_s = backoff_ms / 1000
+                if attempt < self._max_retries - 1:
+                    # Capped exponential backoff with full jitter
+                    backoff_ms = min(
+                        self._retry_backoff_ms * (2**attempt), self._retry_backoff_max_ms
+                    )
+                    backoff_s = random.uniform(0, backoff_ms / 1000)
 
-                    logger.warning(
-                        f"Database error, retrying in {backoff_s}s",
+                    self.logger.warning(
+                        f"Database error, retrying batch in {backoff_s:.2f}s",
                         extra={
                             "attempt": attempt + 1,
-                            "max_retries": self.config.max_retries,
+                            "max_retries": self._max_retries,
+                            "batch_size": len(rows),
                             "error": str(e),
                         },
                     )
@@ -439,12 +771,92 @@ class OrderConsumer:
                     time.sleep(backoff_s)
                 else:
                     # Max retries exhausted
-                    logger.error(
-                        "Max retries exhausted, giving up",
-                        extra={"attempts": self.config.max_retries},
+                    self.logger.error(
+                        "Max retries exhausted, giving up on batch",
+                        extra={"attempts": self._max_retries, "batch_size": len(rows)},
                     )
                     raise
 
+        # max_retries >= 1 (config validation), so the loop always returns or raises
+        raise AssertionError("unreachable")
+
+    def _commit_offsets(self, offsets: dict[tuple[str, int], int], asynchronous: bool) -> None:
+        """
+        Commit offsets to Kafka.
+
+        Args:
+            offsets: Next offset to read per (topic, partition)
+            asynchronous: True for the hot path (fire-and-forget),
+                False on rebalance/shutdown (must land before we let go)
+
+        ASYNC COMMIT SAFETY:
+        - A failed async commit is simply superseded by the next one
+        - Worst case (crash before any later commit): messages redelivered,
+          which the (order_id, created_at) primary key makes harmless
+        """
+        if not offsets:
+            return
+
+        partitions: list[TopicPartition] = [
+            TopicPartition(topic, partition, offset)
+            for (topic, partition), offset in offsets.items()
+        ]
+
+        try:
+            # Literal True/False: the two modes have different return types
+            if asynchronous:
+                self.consumer.commit(offsets=partitions, asynchronous=True)
+            else:
+                self.consumer.commit(offsets=partitions, asynchronous=False)
+        except KafkaException:
+            self.logger.error(
+                "Failed to commit offsets",
+                exc_info=True,
+                extra={"partitions": len(partitions)},
+            )
+
+    def _on_assign(self, consumer: Consumer, partitions: list[TopicPartition]) -> None:
+        """
+        Rebalance callback: partitions assigned to this consumer.
+        """
+        self.logger.info(
+            "Partitions assigned",
+            extra={"partitions": [p.partition for p in partitions]},
+        )
+
+    def _on_revoke(self, consumer: Consumer, partitions: list[TopicPartition]) -> None:
+        """
+        Rebalance callback: partitions about to be taken away.
+
+        Flush the pending batch and its offsets synchronously so the next
+        owner of these partitions starts exactly where we stopped.
+        """
+        self.logger.info(
+            "Partitions revoked, flushing pending batch",
+            extra={"partitions": [p.partition for p in partitions]},
+        )
+        self._flush_batch(asynchronous=False)
+
+    @staticmethod
+    def _peek_order_id(msg: Message) -> str | None:
+        """
+        Best-effort order_id of a message that failed validation (for logs).
+
+        Only used on the error path, so the extra generic parse is free for
+        valid messages.
+
+        Args:
+            msg: Kafka message
+
+        Returns:
+            order_id if the value is a JSON object containing one, else None
+        """
+        try:
+            data = orjson.loads(msg.value() or b"")
+        except orjson.JSONDecodeError:
+            return None
+        return data.get("order_id") if isinstance(data, dict) else None
+
     def _handle_kafka_error(self, error: KafkaError) -> None:
         """
         Handle Kafka-specific errors.
@@ -456,34 +868,30 @@ class OrderConsumer:
         - _PARTITION_EOF: Reached end of partition (normal, not an error)
         - _ALL_BROKERS_DOWN: No brokers available (fatal)
         - _AUTHENTICATION: Authentication failed (fatal)
-        - _TOPIC_AUTHORIZATION: Not authorized for topic (fatal)
+        - TOPIC_AUTHORIZATION_FAILED: Not authorized for topic (fatal)
         """
-        if error.code() == KafkaError._PARTITION_EOF:
-            # Reached end of partition (not an error, just info)
-            self.logger.debug(
-                "Reached end of partition",
-                extra={
-                    "partition": error.partition() if hasattr(error, "partition") else "unknown"
-                },
-            )
-        else:
-            # Real error
-            self.logger.error(
-                f"Kafka error: {error.str()}",
-                extra={
-                    "error_code": error.code(),
-                    "error_name": error.name(),
-                },
-            )
+        code = error.code()
+        if code == KafkaError._PARTITION_EOF:
+            # Reached end of partition (not an error, just info). With
+            # enable.partition.eof=False librdkafka no longer emits these, so
+            # this only guards against configs that re-enable it.
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Reached end of partition")
+            return
+
+        # Real error
+        self.logger.error(
+            f"Kafka error: {error.str()}",
+            extra={
+                "error_code": code,
+                "error_name": error.name(),
+            },
+        )
 
-            # If fatal error, stop consumer
-            if error.code() in [
-                KafkaError._ALL_BROKERS_DOWN,
-                KafkaError._AUTHENTICATION,
-                KafkaError._TOPIC_AUTHORIZATION_FAILED,
-            ]:
-                self.logger.critical("Fatal Kafka error, shutting down")
-                self.stop()
+        # If fatal error, stop consumer
+        if code in _FATAL_KAFKA_ERRORS:
+            self.logger.critical("Fatal Kafka error, shutting down")
+            self.stop()
 
     def stop(self) -> None:
         """
@@ -500,9 +908,11 @@ class OrderConsumer:
         Clean shutdown: close Kafka consumer and database connections.
 
         SHUTDOWN SEQUENCE:
-        1. Close Kafka consumer (commits final offsets)
-        2. Close database connections
-        3. Log final metrics
+        1. Flush pending batch, commit its offsets synchronously
+        2. Stop the DB writer thread
+        3. Close Kafka consumer
+        4. Close database connections
+        5. Log final metrics
         """
         self.logger.info(
             "Consumer shutting down",
@@ -513,6 +923,17 @@ class OrderConsumer:
             },
         )
 
+        # Write + commit everything buffered before leaving the group
+        try:
+            self._flush_batch(asynchronous=False)
+        except Exception:
+            self.logger.error(
+                "Failed to flush pending batch, it will be redelivered", exc_info=True
+            )
+
+        # Stop the writer thread (no batch is in flight after the flush)
+        self._writer.shutdown(wait=True)
+
         # Close Kafka consumer
         try:
             self.consumer.close()
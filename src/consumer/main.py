@@ -52,6 +52,10 @@ from src.consumer.consumer import OrderConsumer
 from src.consumer.database import init_database
 from src.shared.logger import setup_logger
 
+# Same logger object setup_logger(name=__name__) configures in main();
+# fetched once at import instead of inside the signal handler
+_logger = logging.getLogger(__name__)
+
 # ==============================================================================
 # GLOBAL STATE
 # ==============================================================================
@@ -65,6 +69,10 @@ consumer_instance: Optional[OrderConsumer] = None
 # ==============================================================================
 # Handle SIGINT (Ctrl+C) and SIGTERM (Docker stop) for graceful shutdown
 
+# Names of the handled signals, resolved once at import so the handler does
+# as little as possible while it interrupts the poll loop
+_SIGNAL_NAMES = {int(signal.SIGINT): "SIGINT", int(signal.SIGTERM): "SIGTERM"}
+
 
 def signal_handler(signum: int, frame) -> None:
     """
@@ -87,10 +95,9 @@ def signal_handler(signum: int, frame) -> None:
     5. Close database connections
     6. Exit with code 0
     """
-    signal_name = signal.Signals(signum).name
+    signal_name = _SIGNAL_NAMES.get(signum, str(signum))
 
-    logger = logging.getLogger(__name__)
-    logger.info(f"Received {signal_name}, initiating graceful shutdown...")
+    _logger.info(f"Received {signal_name}, initiating graceful shutdown...")
 
     # Stop consumer gracefully
     if consumer_instance:
@@ -113,7 +120,17 @@ def parse_args() -> argparse.Namespace:
     - --log-level: Override LOG_LEVEL env var
     - --log-format: Override LOG_FORMAT env var
     - --help: Show help and exit
+
+    FAST PATH:
+    - Containers run with no arguments (CMD python -m src.consumer.main),
+      so the parser (and its ~2 KB epilog) is only built when there is
+      something to parse
+    - argparse stays a top-level import: pydantic_settings imports it
+      anyway, so deferring it would not save any startup time
     """
+    if len(sys.argv) == 1:
+        return argparse.Namespace(log_level=None, log_format=None)
+
     parser = argparse.ArgumentParser(
         description="Kafka Order Consumer Service",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -207,10 +224,14 @@ def main() -> int:
         return 1
 
     # Override config with CLI arguments if provided
+    # (on a copy - load_config() returns a shared cached instance)
+    overrides = {}
     if args.log_level:
-        config.log_level = args.log_level
+        overrides["log_level"] = args.log_level
     if args.log_format:
-        config.log_format = args.log_format
+        overrides["log_format"] = args.log_format
+    if overrides:
+        config = config.model_copy(update=overrides)
 
     # Set up logging
     logger = setup_logger(
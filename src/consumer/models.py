@@ -23,20 +23,78 @@ PATTERN: DECLARATIVE BASE
 - Inherit from Base to create models
 """
 
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
-from typing import Any, Dict, Optional
+from typing import Any, TypedDict, overload
 
 from sqlalchemy import (
-    DECIMAL,
+    DDL,
     TIMESTAMP,
+    BigInteger,
     CheckConstraint,
     Index,
+    Numeric,
+    PrimaryKeyConstraint,
     String,
+    Table,
+    cast,
+    event,
+    inspect,
     text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+from sqlalchemy.sql.elements import ColumnElement
+
+# ==============================================================================
+# MONEY HELPERS
+# ==============================================================================
+
+
+def amount_to_cents(amount: Any) -> int:
+    """
+    Convert a dollar amount (float, Decimal or numeric string) to integer cents.
+
+    Goes through str() → Decimal so 21.47 becomes exactly 2147 cents, not
+    the binary float 21.469999... truncated to 2146.
+    """
+    return round(Decimal(str(amount)) * 100)
+
+
+@overload
+def cents_to_amount(cents: int) -> Decimal: ...
+
+
+@overload
+def cents_to_amount(cents: None) -> None: ...
+
+
+def cents_to_amount(cents: int | None) -> Decimal | None:
+    """Convert integer cents to an exact dollar Decimal (2147 → Decimal("21.47"))."""
+    return None if cents is None else Decimal(cents).scaleb(-2)
+
+
+# ==============================================================================
+# ORDER ITEM SHAPE
+# ==============================================================================
+
+
+class OrderItem(TypedDict, total=False):
+    """
+    One element of Order.items, as emitted by the producer.
+
+    Static typing only: at runtime items are plain dicts (decoded by msgspec,
+    encoded to JSONB by orjson), so there is no per-item object to build.
+    """
+
+    item_id: str
+    name: str
+    quantity: int
+    price: float
+    subtotal: float
+
 
 # ==============================================================================
 # DECLARATIVE BASE
@@ -80,10 +138,11 @@ class Order(Base):
     Each instance represents one order consumed from Kafka and persisted to DB.
 
     Attributes:
-        order_id: Unique order identifier (PRIMARY KEY)
+        order_id: Unique order identifier (PRIMARY KEY with created_at)
         customer_id: Customer who placed the order (Kafka partition key)
         items: Order items as JSON array
-        total_amount: Total order cost
+        total_amount_cents: Total order cost in cents (BIGINT column)
+        total_amount: Total order cost in dollars (Decimal, derived from cents)
         status: Order status (pending, completed, etc.)
         created_at: When order was created (from Kafka message)
         processed_at: When order was written to database
@@ -96,10 +155,11 @@ class Order(Base):
     # ==========================================================================
     # order_id is the natural business key from Kafka message
     # Format: ORD-YYYYMMDD-NNNNN
-    # primary_key=True automatically creates index
+    # The primary key is (order_id, created_at) - see PARTITIONING in
+    # __table_args__ - and automatically creates an index
 
     order_id: Mapped[str] = mapped_column(
-        String(50), primary_key=True, comment="Unique order identifier from Kafka message"
+        String(50), comment="Unique order identifier from Kafka message"
     )
 
     # ==========================================================================
@@ -108,11 +168,14 @@ class Order(Base):
     # customer_id is used as Kafka partition key
     # All orders from same customer go to same partition (ordering guarantee)
     # nullable=False means NOT NULL constraint in SQL
+    #
+    # No single-column index: customer_id is the leading column of
+    # idx_orders_customer_created, which also serves WHERE customer_id = ?
+    # (one less index to update on every INSERT)
 
     customer_id: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
-        index=True,  # Creates idx_orders_customer_id index
         comment="Customer identifier, used as Kafka partition key",
     )
 
@@ -139,33 +202,60 @@ class Order(Base):
     # - JSON: Text format, not indexed, faster writes, slower reads
     # - Use JSONB for querying, JSON for pure storage
     #
-    # GIN INDEX (created in SQL):
+    # GIN INDEX (created in SQL, jsonb_path_ops operator class):
     # - Allows queries like: WHERE items @> '[{"name": "Burger"}]'
-    # - Full-text search inside JSON
+    # - Supports containment (@>) and jsonpath (@?, @@) only - NOT the
+    #   key-exists operators (?, ?|, ?&)
+    #
+    # ENCODING: orjson on every write path - the engine's json_serializer
+    # (INSERT/ORM) and bulk_copy_orders() (COPY) - never the stdlib json module
 
-    items: Mapped[dict] = mapped_column(
+    items: Mapped[list[OrderItem]] = mapped_column(
         JSONB,
         nullable=False,
         comment="Order items as JSONB array. Indexed with GIN for fast queries.",
     )
 
     # ==========================================================================
-    # TOTAL AMOUNT (DECIMAL)
+    # TOTAL AMOUNT (INTEGER CENTS)
     # ==========================================================================
-    # DECIMAL(10, 2) for money (exact precision)
-    # - 10 total digits, 2 after decimal point
-    # - Max value: 99,999,999.99
+    # Money is stored as BIGINT cents (exact, like DECIMAL)
+    # - 21.47 dollars → 2147
     # - Never use FLOAT for money (rounding errors!)
     #
+    # WHY NOT DECIMAL(10, 2)?
+    # - NUMERIC is variable-length and slow to encode/decode (base-10000
+    #   digit arrays); BIGINT is a fixed 8 bytes, a plain machine integer
+    # - Cheaper binary COPY of every consumed order, smaller rows
+    # - The CHECK is a single integer comparison
+    #
+    # Python code keeps using Order.total_amount (Decimal dollars, see the
+    # hybrid property below); only raw SQL needs total_amount_cents / 100.0
+    #
     # CheckConstraint ensures positive amounts
 
-    total_amount: Mapped[float] = mapped_column(
-        DECIMAL(10, 2),
-        CheckConstraint("total_amount > 0", name="check_positive_amount"),
+    total_amount_cents: Mapped[int] = mapped_column(
+        BigInteger,
+        CheckConstraint("total_amount_cents > 0", name="check_positive_amount"),
         nullable=False,
-        comment="Total order amount. Must be positive.",
+        comment="Total order amount in cents. Must be positive.",
     )
 
+    @hybrid_property
+    def total_amount(self) -> Decimal:
+        """Total order amount in dollars (exact Decimal with 2 places)."""
+        return cents_to_amount(self.total_amount_cents)
+
+    @total_amount.inplace.setter
+    def _total_amount_setter(self, value: Any) -> None:
+        self.total_amount_cents = amount_to_cents(value)
+
+    @total_amount.inplace.expression
+    @classmethod
+    def _total_amount_expression(cls) -> ColumnElement[Decimal]:
+        # Usable in queries: Order.total_amount > 20 → total_amount_cents / 100
+        return cast(cls.total_amount_cents / 100, Numeric(12, 2))
+
     # ==========================================================================
     # ORDER STATUS
     # ==========================================================================
@@ -186,16 +276,23 @@ class Order(Base):
     # 2. processed_at: When consumer wrote to database (auto-set)
     #
     # Latency = processed_at - created_at (shows consumer lag)
+    #
+    # TIMESTAMP WITH TIME ZONE (timestamptz): an absolute instant, stored
+    # as UTC. A plain TIMESTAMP would store whatever wall-clock value the
+    # session time zone produced, so readers/writers in different zones
+    # could disagree; with timestamptz Python gets aware UTC datetimes back
+    #
+    # Time-range queries use the BRIN index idx_orders_created_at_brin
+    # (see __table_args__), not a B-tree on this column
 
     created_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP,
+        TIMESTAMP(timezone=True),
         nullable=False,
-        index=True,  # For time-based queries
         comment="Order creation timestamp from Kafka message",
     )
 
-    processed_at: Mapped[Optional[datetime]] = mapped_column(
-        TIMESTAMP,
+    processed_at: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP(timezone=True),
         server_default=text("CURRENT_TIMESTAMP"),  # Database sets this
         comment="Database write timestamp, used for latency tracking",
     )
@@ -206,14 +303,70 @@ class Order(Base):
     # Additional indexes defined at table level (beyond column-level indexes)
 
     __table_args__ = (
-        # GIN index for JSONB queries (full-text search in items)
-        Index("idx_orders_items_gin", "items", postgresql_using="gin"),
+        # GIN index for JSONB containment queries (items @> '[{...}]')
+        # jsonb_path_ops: one hashed entry per path+value instead of one per
+        # key and per value (jsonb_ops), so the index is smaller, faster
+        # for @>, and cheaper to update on every INSERT
+        Index(
+            "idx_orders_items_gin",
+            "items",
+            postgresql_using="gin",
+            postgresql_ops={"items": "jsonb_path_ops"},
+        ),
         # Composite index for common query: customer + time range
         # Example: "Get customer X's orders from last month"
         # First column (customer_id) for filtering, second (created_at) for sorting
-        Index("idx_orders_customer_created", "customer_id", "created_at"),
-        # Table comment
-        {"comment": "Order records consumed from Kafka food-orders topic"},
+        # INCLUDE makes it a covering index: listings that select only
+        # order_id/total_amount_cents/status become Index Only Scans (no heap
+        # fetch), provided VACUUM keeps the visibility map current
+        Index(
+            "idx_orders_customer_created",
+            "customer_id",
+            "created_at",
+            postgresql_include=["order_id", "total_amount_cents", "status"],
+        ),
+        # BRIN index for global time-range queries ("orders in last hour")
+        # Orders arrive roughly in created_at order, so heap position and
+        # created_at are correlated: BRIN keeps only the min/max created_at
+        # per block range (32 pages). Tiny compared to a B-tree and nearly
+        # free to maintain on INSERT; range scans read only matching ranges
+        # (per-customer ordering still comes from idx_orders_customer_created)
+        Index(
+            "idx_orders_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        # Partial index for the open-order backlog ("orders to retry/finish")
+        # Only pending/processing rows are indexed; most rows end up
+        # completed and leave the index, so it stays small and in RAM.
+        # Queries must repeat the predicate to use it:
+        #   WHERE status IN ('pending', 'processing') ORDER BY created_at
+        Index(
+            "idx_orders_open",
+            "status",
+            "created_at",
+            postgresql_where=text("status IN ('pending', 'processing')"),
+        ),
+        # PARTITIONING (monthly RANGE on created_at):
+        # - Each month is its own table with its own, small indexes, so
+        #   index maintenance on INSERT stays cheap as history grows
+        # - Time-range queries only scan the matching months (pruning)
+        # - Old months are archived with DETACH PARTITION / DROP TABLE
+        #   instead of a huge DELETE
+        # - A unique constraint on a partitioned table must include the
+        #   partition key, hence PRIMARY KEY (order_id, created_at).
+        #   Kafka redelivers the same message bytes (same created_at), so
+        #   ON CONFLICT (order_id, created_at) still skips duplicates
+        # - Monthly partitions are created ahead of time by
+        #   create_orders_partition() (see create_partitions());
+        #   orders_default catches rows for months without a partition
+        PrimaryKeyConstraint("order_id", "created_at", name="orders_pkey"),
+        # Table comment + partitioning
+        {
+            "comment": "Order records consumed from Kafka food-orders topic",
+            "postgresql_partition_by": "RANGE (created_at)",
+        },
     )
 
     # ==========================================================================
@@ -221,20 +374,39 @@ class Order(Base):
     # ==========================================================================
     # Useful for debugging and logging
 
+    # Both read the instance __dict__ (already-loaded values) instead of the
+    # instrumented attributes: formatting an expired instance (e.g. logging
+    # it after commit) must not trigger a refresh SELECT, and a detached one
+    # must not raise DetachedInstanceError. Unloaded columns print as None,
+    # except order_id: the identity key (primary key) survives expiry.
+
+    def _loaded_order_id(self) -> str | None:
+        """order_id without triggering a load (falls back to the identity key)."""
+        order_id = self.__dict__.get("order_id")
+        if order_id is None:
+            identity = inspect(self).identity
+            order_id = identity[0] if identity else None
+        return order_id
+
     def __repr__(self) -> str:
         """String representation of Order instance."""
+        d = self.__dict__
         return (
-            f"<Order(order_id={self.order_id}, "
-            f"customer_id={self.customer_id}, "
-            f"total_amount={self.total_amount}, "
-            f"status={self.status})>"
+            f"<Order(order_id={self._loaded_order_id()}, "
+            f"customer_id={d.get('customer_id')}, "
+            f"total_amount={cents_to_amount(d.get('total_amount_cents'))}, "
+            f"status={d.get('status')})>"
         )
 
     def __str__(self) -> str:
         """Human-readable string representation."""
-        return f"Order {self.order_id} - {self.customer_id} - ${self.total_amount}"
+        d = self.__dict__
+        return (
+            f"Order {self._loaded_order_id()} - {d.get('customer_id')} - "
+            f"${cents_to_amount(d.get('total_amount_cents'))}"
+        )
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self) -> dict[str, Any]:
         """
         Convert Order instance to dictionary.
 
@@ -259,8 +431,50 @@ class Order(Base):
             "processed_at": self.processed_at.isoformat() if self.processed_at else None,
         }
 
+    @staticmethod
+    def row_from_kafka_message(message_data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Convert Kafka message data to a plain column dict (no ORM instance).
+
+        For Core bulk inserts: INSERT statements take dicts directly, which
+        skips ORM object construction, identity map bookkeeping and
+        unit-of-work flush for every order.
+
+        Args:
+            message_data: Deserialized JSON from Kafka message
+
+        Returns:
+            Dictionary keyed by column name, ready for insert(Order.__table__)
+
+        Raises:
+            KeyError: If a required field is missing
+            ValueError: If created_at is not a valid ISO 8601 timestamp
+
+        Usage:
+            >>> row = Order.row_from_kafka_message(data)
+            >>> session.execute(insert(Order.__table__), [row])
+        """
+        # Parse created_at timestamp (ISO 8601 string → datetime)
+        created_at_str = message_data["created_at"]
+
+        # Handle both formats: "2025-01-10T14:30:00.000Z" and "2025-01-10T14:30:00+00:00"
+        if created_at_str.endswith("Z"):
+            created_at_str = created_at_str[:-1] + "+00:00"
+
+        return {
+            "order_id": message_data["order_id"],
+            "customer_id": message_data["customer_id"],
+            "customer_name": message_data["customer_name"],
+            "customer_email": message_data["customer_email"],
+            "items": message_data["items"],
+            "total_amount_cents": amount_to_cents(message_data["total_amount"]),
+            "status": message_data.get("status", "pending"),
+            "created_at": datetime.fromisoformat(created_at_str),
+            # processed_at is auto-generated by database
+        }
+
     @classmethod
-    def from_kafka_message(cls, message_data: Dict[str, Any]) -> "Order":
+    def from_kafka_message(cls, message_data: dict[str, Any]) -> "Order":
         """
         Create Order instance from Kafka message data.
 
@@ -279,31 +493,199 @@ class Order(Base):
             >>> session.commit()
 
         IDEMPOTENCY:
-        - order_id is primary key
-        - Duplicate inserts will raise IntegrityError
-        - Consumer should catch and log (message already processed)
+        - (order_id, created_at) is the primary key
+        - session.add() of a duplicate raises IntegrityError
+        - The consumer avoids that path entirely: it bulk inserts column
+          dicts with ON CONFLICT (order_id, created_at) DO NOTHING
         """
-        # Parse created_at timestamp (ISO 8601 string → datetime)
-        created_at_str = message_data["created_at"]
+        return cls(**cls.row_from_kafka_message(message_data))
 
-        # Handle both formats: "2025-01-10T14:30:00.000Z" and "2025-01-10T14:30:00+00:00"
-        if created_at_str.endswith("Z"):
-            created_at_str = created_at_str[:-1] + "+00:00"
+    @classmethod
+    def items_contains(cls, key: str, value: Any) -> ColumnElement[bool]:
+        """
+        Filter for orders with at least one item where item[key] == value.
 
-        created_at = datetime.fromisoformat(created_at_str)
-
-        # Create Order instance
-        return cls(
-            order_id=message_data["order_id"],
-            customer_id=message_data["customer_id"],
-            customer_name=message_data["customer_name"],
-            customer_email=message_data["customer_email"],
-            items=message_data["items"],
-            total_amount=Decimal(str(message_data["total_amount"])),
-            status=message_data.get("status", "pending"),
-            created_at=created_at,
-            # processed_at is auto-generated by database
-        )
+        Args:
+            key: Item field name (e.g. "name")
+            value: Value to match (e.g. "Burger")
+
+        Returns:
+            SQL expression: items @> '[{"<key>": <value>}]'
+
+        Usage:
+            >>> session.query(Order).filter(Order.items_contains("name", "Burger")).all()
+
+        WHY CONTAINMENT (@>)?
+        - idx_orders_items_gin (jsonb_path_ops) only accelerates @>, @? and @@
+        - An equivalent filter written with ->> (e.g. items->0->>'name' =
+          'Burger', or jsonb_array_elements(items)->>'name') cannot use
+          the GIN index and scans every row
+        - items is an ARRAY of objects, so the fragment is wrapped in a
+          list: '[{"name": "Burger"}]' (a bare object never matches an array)
+        """
+        return cls.items.contains([{key: value}])
+
+    @classmethod
+    def insert_new(cls, session: Session, rows: list[dict[str, Any]]) -> int:
+        """
+        Insert orders in bulk, skipping order_ids that already exist.
+
+        Args:
+            session: Active session (caller commits)
+            rows: Order column dicts (see row_from_kafka_message)
+
+        Returns:
+            Number of rows actually inserted (the rest were duplicates)
+
+        Usage:
+            >>> rows = [Order.row_from_kafka_message(data) for data in messages]
+            >>> with db_manager.get_session() as session:
+            ...     inserted = Order.insert_new(session, rows)
+
+        WHY NOT try/except IntegrityError PER ROW?
+        - Kafka delivers at-least-once: replays after a rebalance or crash
+          re-send orders that are already stored
+        - A duplicate session.add() costs a round trip, an IntegrityError
+          and a ROLLBACK - per row, so retry storms multiply it
+        - ON CONFLICT (order_id, created_at) DO NOTHING turns duplicates into no-ops
+          inside one statement; RETURNING order_id yields one row per order
+          actually inserted, so duplicates are counted without exceptions
+        - session.execute(stmt, rows) is an executemany: SQLAlchemy renders
+          it as multi-row INSERT ... VALUES batches (insertmanyvalues)
+        - The statement (_INSERT_NEW_ORDERS) is built once at import, so it
+          is neither rebuilt nor recompiled per batch, and psycopg prepares
+          it server-side after prepare_threshold executions
+        """
+        if not rows:
+            return 0
+        return len(session.execute(_INSERT_NEW_ORDERS, rows).all())
+
+    @classmethod
+    def create_partitions(cls, session: Session, months_ahead: int = 1) -> list[str]:
+        """
+        Create the monthly partitions for this month and the next months_ahead.
+
+        Args:
+            session: Active session (caller commits)
+            months_ahead: How many months after the current (UTC) one
+
+        Returns:
+            Partition names, e.g. ["orders_2025_01", "orders_2025_02"]
+
+        Usage:
+            >>> with db_manager.get_session() as session:
+            ...     Order.create_partitions(session)
+
+        WHY AHEAD OF TIME?
+        - Rows for a month without a partition land in orders_default
+        - Once orders_default holds rows for a month, CREATE TABLE ...
+          PARTITION OF for that month fails, so the partition has to exist
+          before the month's first order arrives
+        - create_orders_partition() uses CREATE TABLE IF NOT EXISTS, so
+          calling this repeatedly (every replica, every hour) is harmless
+        """
+        month = datetime.now(UTC).date().replace(day=1)
+        names = []
+        for _ in range(months_ahead + 1):
+            session.execute(_CREATE_ORDERS_PARTITION, {"day": month})
+            names.append(f"orders_{month:%Y_%m}")
+            # Day 1 + 32 days always lands in the following month
+            month = (month + timedelta(days=32)).replace(day=1)
+        return names
+
+    @classmethod
+    def bulk_upsert(cls, session: Session, rows: list[dict[str, Any]]) -> int:
+        """
+        Insert new orders and update the status of existing ones, in bulk.
+
+        Args:
+            session: Active session (caller commits)
+            rows: Order column dicts (see row_from_kafka_message)
+
+        Returns:
+            Number of distinct orders inserted or updated
+
+        Usage:
+            >>> rows = [Order.row_from_kafka_message(data) for data in messages]
+            >>> with db_manager.get_session() as session:
+            ...     Order.bulk_upsert(session, rows)
+
+        WHY NOT session.add() / query-and-update PER ROW?
+        - One statement for the whole list: psycopg 3 sends executemany
+          in pipeline mode, without waiting for a round trip per row
+        - ON CONFLICT (order_id, created_at) DO UPDATE SET status = EXCLUDED.status:
+          existing orders get the new status, no IntegrityError/ROLLBACK
+        - The statement (_UPSERT_ORDER_STATUS) is built once at import
+
+        DUPLICATES IN ONE CALL:
+        - DO UPDATE may not touch the same row twice in one command, so
+          rows are de-duplicated by primary key first (last one wins)
+        """
+        if not rows:
+            return 0
+        unique_rows = list({(row["order_id"], row["created_at"]): row for row in rows}.values())
+        session.execute(_UPSERT_ORDER_STATUS, unique_rows)
+        return len(unique_rows)
+
+
+# Metadata.create_all() (tests, local setup) only creates the partitioned
+# parent; without at least a DEFAULT partition every INSERT would fail.
+# create_orders_partition() is the same function as in init.sql, so
+# Order.create_partitions() works on either schema.
+event.listen(
+    Order.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS orders_default PARTITION OF orders DEFAULT"),
+)
+event.listen(
+    Order.__table__,
+    "after_create",
+    DDL("""
+CREATE OR REPLACE FUNCTION create_orders_partition(day DATE)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    month_start DATE := date_trunc('month', day)::DATE;
+BEGIN
+    EXECUTE 'CREATE TABLE IF NOT EXISTS '
+        || quote_ident('orders_' || to_char(month_start, 'YYYY_MM'))
+        || ' PARTITION OF orders FOR VALUES FROM ('
+        || quote_literal(month_start::TIMESTAMP AT TIME ZONE 'UTC')
+        || ') TO ('
+        || quote_literal((month_start + INTERVAL '1 month')::TIMESTAMP AT TIME ZONE 'UTC')
+        || ')';
+END;
+$$
+"""),
+)
+
+# Built once for Order.create_partitions()
+_CREATE_ORDERS_PARTITION = text("SELECT create_orders_partition(:day)")
+
+# Order.__table__ is typed as a generic FromClause; insert() takes a Table
+_ORDERS_TABLE = Order.__table__
+assert isinstance(_ORDERS_TABLE, Table)
+
+# Conflict target for the idempotent writes: the primary key
+# (order_id alone can't be unique on a table partitioned by created_at)
+_ORDER_KEY = ["order_id", "created_at"]
+
+# Built once for Order.insert_new(): duplicates are skipped, and RETURNING
+# reports which orders were actually inserted
+_INSERT_NEW_ORDERS = (
+    pg_insert(_ORDERS_TABLE)
+    .on_conflict_do_nothing(index_elements=_ORDER_KEY)
+    .returning(_ORDERS_TABLE.c.order_id)
+)
+
+# Built once for Order.bulk_upsert(): new orders are inserted, existing ones
+# only have their status updated
+_upsert_orders = pg_insert(_ORDERS_TABLE)
+_UPSERT_ORDER_STATUS = _upsert_orders.on_conflict_do_update(
+    index_elements=_ORDER_KEY,
+    set_={"status": _upsert_orders.excluded.status},
+)
 
 
 # ==============================================================================
@@ -341,9 +723,9 @@ session.commit()
 orders = session.query(Order).filter(Order.customer_id == "CUST-00001").all()
 
 # Query with JSONB (find orders with Burger)
-burger_orders = session.query(Order).filter(
-    Order.items.contains([{"name": "Burger"}])
-).all()
+# Uses items @> '[{"name": "Burger"}]', which the GIN index can serve;
+# avoid items->...->>'name' = 'Burger' style filters (full table scan)
+burger_orders = session.query(Order).filter(Order.items_contains("name", "Burger")).all()
 
 # Time-based query (last 24 hours)
 from datetime import timedelta
@@ -357,13 +739,23 @@ order = session.query(Order).filter(Order.order_id == "ORD-20250110-00001").firs
 order.status = "completed"
 session.commit()
 
-# Handle duplicates (idempotency)
-from sqlalchemy.exc import IntegrityError
-try:
-    session.add(duplicate_order)
-    session.commit()
-except IntegrityError:
-    session.rollback()
+# Bulk status updates / upserts - one statement instead of one per order
+rows = [Order.row_from_kafka_message(data) for data in status_messages]
+Order.bulk_upsert(session, rows)
+session.commit()
+
+# Handle duplicates (idempotency) - no exception, duplicates are a no-op.
+# The conflict target must be the whole primary key (order_id, created_at);
+# Order.insert_new() uses a prebuilt statement doing exactly this
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+stmt = (
+    pg_insert(Order.__table__)
+    .on_conflict_do_nothing(index_elements=["order_id", "created_at"])
+    .returning(Order.__table__.c.order_id)
+)
+inserted = len(session.execute(stmt, [Order.row_from_kafka_message(data)]).all())
+session.commit()
+if inserted == 0:
     print("Order already exists!")
 
 # Close session
@@ -17,10 +17,13 @@
 --
 -- DESIGN DECISIONS:
 --
--- 1. PRIMARY KEY: order_id (VARCHAR)
---    - Natural key from business domain (e.g., "ORD-20250110-00001")
+-- 1. PRIMARY KEY: (order_id, created_at)
+--    - order_id: natural key from business domain (e.g., "ORD-20250110-00001")
 --    - Better than surrogate UUID for debugging/support
---    - Ensures idempotency (duplicate messages don't create duplicate rows)
+--    - Ensures idempotency (duplicate messages don't create duplicate rows):
+--      a redelivered Kafka message carries the same order_id AND created_at
+--    - created_at is part of the key because the table is partitioned by it
+--      (PostgreSQL requires the partition key in every unique constraint)
 --
 -- 2. JSONB COLUMN: items
 --    - PostgreSQL's JSONB (binary JSON) is indexed and queryable
@@ -32,12 +35,20 @@
 --    - created_at: When order was created (from Kafka message)
 --    - processed_at: When consumer wrote to database (auto-set by DB)
 --    - Helps track processing latency (processed_at - created_at)
+--    - TIMESTAMPTZ: absolute instants stored as UTC, independent of the
+--      client's session time zone (plain TIMESTAMP is ambiguous)
+--
+-- 4. PARTITIONED BY RANGE (created_at), one partition per month:
+--    - Per-partition indexes stay small, so INSERTs stay fast as history grows
+--    - Time-range queries skip months outside the range (partition pruning)
+--    - Archiving a month is DETACH PARTITION / DROP TABLE, not a huge DELETE
+--    - Partition routing is transparent to the consumer (INSERT INTO orders)
 --
 
 CREATE TABLE IF NOT EXISTS orders (
-    -- Primary key: Natural business identifier from Kafka message
+    -- Natural business identifier from Kafka message
     -- Format: ORD-YYYYMMDD-NNNNN (e.g., ORD-20250110-00001)
-    order_id VARCHAR(50) PRIMARY KEY,
+    order_id VARCHAR(50) NOT NULL,
 
     -- Customer identifier (used as Kafka partition key)
     -- All orders from same customer go to same partition (maintains ordering)
@@ -54,22 +65,75 @@ CREATE TABLE IF NOT EXISTS orders (
     -- JSONB allows indexing and querying (GIN index below)
     items JSONB NOT NULL,
 
-    -- Total order amount (calculated from items)
-    -- DECIMAL(10,2) stores up to $99,999,999.99 with exact precision
+    -- Total order amount in cents (calculated from items)
+    -- BIGINT cents is exact like DECIMAL, but fixed-size and much cheaper
+    -- to encode/decode and compare (21.47 dollars → 2147)
     -- Never use FLOAT/DOUBLE for money (rounding errors!)
-    total_amount DECIMAL(10, 2) NOT NULL CHECK (total_amount > 0),
+    total_amount_cents BIGINT NOT NULL
+        CONSTRAINT check_positive_amount CHECK (total_amount_cents > 0),
 
     -- Order status (pending, processing, completed, failed, etc.)
     -- Could be ENUM in production for type safety
     status VARCHAR(20) NOT NULL,
 
     -- When the order was created (from Kafka message timestamp)
-    created_at TIMESTAMP NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL,
 
     -- When the order was written to database (auto-set by PostgreSQL)
     -- Used to measure consumer processing latency
-    processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
+    processed_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT orders_pkey PRIMARY KEY (order_id, created_at)
+) PARTITION BY RANGE (created_at);
+
+-- ==============================================================================
+-- PARTITIONS
+-- ==============================================================================
+--
+-- create_orders_partition(day) creates the monthly partition containing
+-- that day, e.g. orders_2025_01 FOR VALUES FROM ('2025-01-01') TO ('2025-02-01').
+-- Idempotent (IF NOT EXISTS). The same function is defined by the Order
+-- model's after_create DDL (src/consumer/models.py) for create_all() setups.
+--
+-- SCHEDULING: each month's partition must exist BEFORE the month starts.
+-- The consumer does this: OrderConsumer.start() and then its loop, once an
+-- hour, call DatabaseManager.ensure_partitions(), which creates the current
+-- and next month. Without a running consumer, run it by hand or from cron:
+--   SELECT create_orders_partition((CURRENT_DATE + INTERVAL '1 month')::date);
+--
+-- orders_default (DEFAULT partition) catches rows for months that have no
+-- partition yet, so INSERTs never fail. Keep it empty: a month's partition
+-- cannot be created while orders_default holds rows for that month.
+--
+-- ARCHIVING a month:
+--   ALTER TABLE orders DETACH PARTITION orders_2025_01;
+
+CREATE OR REPLACE FUNCTION create_orders_partition(day DATE)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    month_start DATE := date_trunc('month', day)::DATE;
+BEGIN
+    -- Bounds are UTC month boundaries, whatever the session time zone.
+    -- quote_ident/quote_literal rather than format(): the body has no "%",
+    -- so the copy in models.py runs unchanged through SQLAlchemy's DDL().
+    EXECUTE 'CREATE TABLE IF NOT EXISTS '
+        || quote_ident('orders_' || to_char(month_start, 'YYYY_MM'))
+        || ' PARTITION OF orders FOR VALUES FROM ('
+        || quote_literal(month_start::TIMESTAMP AT TIME ZONE 'UTC')
+        || ') TO ('
+        || quote_literal((month_start + INTERVAL '1 month')::TIMESTAMP AT TIME ZONE 'UTC')
+        || ')';
+END;
+$$;
+
+-- Current and next month
+SELECT create_orders_partition(CURRENT_DATE);
+SELECT create_orders_partition((CURRENT_DATE + INTERVAL '1 month')::DATE);
+
+-- Safety net for rows outside all monthly partitions
+CREATE TABLE IF NOT EXISTS orders_default PARTITION OF orders DEFAULT;
 
 -- ==============================================================================
 -- INDEXES
@@ -77,38 +141,57 @@ CREATE TABLE IF NOT EXISTS orders (
 --
 -- INDEXING STRATEGY:
 --
--- 1. PRIMARY KEY INDEX (order_id):
+-- 1. PRIMARY KEY INDEX (order_id, created_at):
 --    - Automatically created by PostgreSQL for PRIMARY KEY
 --    - Used for idempotency checks (INSERT ... ON CONFLICT)
 --
--- 2. INDEX ON created_at:
+-- All indexes below are created on the partitioned table, so PostgreSQL
+-- creates a matching (smaller) index on every partition, including
+-- partitions created later.
+--
+-- 2. BRIN INDEX ON created_at:
 --    - Queries like "orders from last hour" need this
 --    - Time-based queries are common (analytics, monitoring)
---    - B-tree index (default) works well for range queries
+--    - Orders are inserted roughly in created_at order, so BRIN (min/max
+--      per block range) fits: a tiny fraction of a B-tree's size and almost
+--      no INSERT overhead, still fast for range scans
 --
--- 3. INDEX ON customer_id:
+-- 3. customer_id (via idx_orders_customer_created):
 --    - Queries like "all orders for customer X"
 --    - Matches Kafka partition key (natural query pattern)
+--    - No separate single-column index: the composite index's leading
+--      column serves WHERE customer_id = ? just as well, and every extra
+--      index slows down the write-heavy consumer
 --
 -- 4. GIN INDEX ON items (JSONB):
 --    - Allows fast queries inside JSON structure
 --    - Example: Find all orders containing "Burger"
 --    - GIN = Generalized Inverted Index (for composite values like JSON, arrays)
+--    - jsonb_path_ops operator class: smaller and faster than the default
+--      jsonb_ops for containment (@>), but key-exists (?, ?|, ?&) cannot use it
 --
 
--- Index for time-based queries (e.g., "orders in last 24 hours")
-CREATE INDEX IF NOT EXISTS idx_orders_created_at ON orders(created_at);
-
--- Index for customer-based queries (e.g., "all orders for CUST-001")
-CREATE INDEX IF NOT EXISTS idx_orders_customer_id ON orders(customer_id);
+-- BRIN index for time-based queries (e.g., "orders in last 24 hours")
+CREATE INDEX IF NOT EXISTS idx_orders_created_at_brin ON orders USING BRIN(created_at)
+    WITH (pages_per_range = 32);
 
 -- GIN index for querying inside JSONB items column
 -- Enables queries like: WHERE items @> '[{"name": "Burger"}]'
-CREATE INDEX IF NOT EXISTS idx_orders_items_gin ON orders USING GIN(items);
+CREATE INDEX IF NOT EXISTS idx_orders_items_gin ON orders USING GIN(items jsonb_path_ops);
 
 -- Composite index for common query pattern: customer + time range
 -- Example: "Customer X's orders from last month"
-CREATE INDEX IF NOT EXISTS idx_orders_customer_created ON orders(customer_id, created_at);
+-- Covering index (INCLUDE): listings of order_id/total_amount_cents/status are
+-- answered by an Index Only Scan without visiting the table (heap), as long
+-- as autovacuum keeps the visibility map up to date
+CREATE INDEX IF NOT EXISTS idx_orders_customer_created ON orders(customer_id, created_at)
+    INCLUDE (order_id, total_amount_cents, status);
+
+-- Partial index for the open-order backlog (e.g. "orders to retry")
+-- Only pending/processing rows are indexed: completed orders drop out of
+-- the index, so it stays small. Queries must repeat the WHERE predicate.
+CREATE INDEX IF NOT EXISTS idx_orders_open ON orders(status, created_at)
+    WHERE status IN ('pending', 'processing');
 
 -- ==============================================================================
 -- COMMENTS (PostgreSQL Documentation)
@@ -133,8 +216,8 @@ COMMENT ON COLUMN orders.customer_email IS
 COMMENT ON COLUMN orders.items IS
 'Order items as JSONB array. Example: [{"name": "Burger", "quantity": 2, "price": 8.99}]';
 
-COMMENT ON COLUMN orders.total_amount IS
-'Total order amount in dollars. Calculated from sum of items. Must be > 0.';
+COMMENT ON COLUMN orders.total_amount_cents IS
+'Total order amount in cents (2147 = $21.47). Calculated from sum of items. Must be > 0.';
 
 COMMENT ON COLUMN orders.status IS
 'Order status: pending, processing, completed, failed, etc.';
@@ -181,7 +264,7 @@ COMMENT ON COLUMN orders.processed_at IS
 --   ORDER BY created_at DESC;
 --
 -- Total revenue per customer:
---   SELECT customer_id, SUM(total_amount) as total_spent
+--   SELECT customer_id, SUM(total_amount_cents) / 100.0 as total_spent
 --   FROM orders
 --   GROUP BY customer_id
 --   ORDER BY total_spent DESC;
@@ -0,0 +1,49 @@
+-- ==============================================================================
+-- MIGRATION 002: Rebuild items GIN index with jsonb_path_ops
+-- ==============================================================================
+--
+-- Migration: 002_items_gin_jsonb_path_ops
+-- Description: Switch idx_orders_items_gin to the jsonb_path_ops operator class
+-- Author: Kafka Food Pipeline
+--
+-- WHY jsonb_path_ops?
+-- - Our JSONB queries only use containment: items @> '[{"name": "Burger"}]'
+-- - jsonb_path_ops stores one hash per path+value (jsonb_ops: one entry per
+--   key AND per value), so the index is smaller and @> lookups touch fewer pages
+-- - Less index data to write on every INSERT (consumer hot path)
+-- - Trade-off: key-exists operators (?, ?|, ?&) can no longer use the index
+--
+-- MIGRATION STRATEGY:
+-- - CONCURRENTLY: no long write lock on orders while the index is rebuilt
+-- - CONCURRENTLY cannot run inside a transaction block (no BEGIN/COMMIT)
+-- - New index is built under a temporary name, then swapped in, so
+--   containment queries keep an index during the whole migration
+-- - Idempotent: Safe to run multiple times (IF EXISTS / IF NOT EXISTS)
+--
+-- ==============================================================================
+
+-- ==============================================================================
+-- FORWARD MIGRATION (Apply Changes)
+-- ==============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_orders_items_gin_path
+    ON orders USING GIN (items jsonb_path_ops);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_orders_items_gin;
+
+ALTER INDEX IF EXISTS idx_orders_items_gin_path RENAME TO idx_orders_items_gin;
+
+\echo '✅ Migration 002: items GIN index rebuilt with jsonb_path_ops!'
+
+-- ==============================================================================
+-- ROLLBACK MIGRATION (Revert Changes)
+-- ==============================================================================
+--
+-- To rollback this migration, run:
+--
+-- CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_orders_items_gin_ops
+--     ON orders USING GIN (items);
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_orders_items_gin;
+-- ALTER INDEX IF EXISTS idx_orders_items_gin_ops RENAME TO idx_orders_items_gin;
+--
+-- ==============================================================================
@@ -0,0 +1,58 @@
+-- ==============================================================================
+-- MIGRATION 003: Make idx_orders_customer_created a covering index
+-- ==============================================================================
+--
+-- Migration: 003_customer_created_covering_index
+-- Description: Rebuild idx_orders_customer_created with INCLUDE (order_id, total_amount, status)
+-- Author: Kafka Food Pipeline
+--
+-- WHY A COVERING INDEX?
+-- - Customer listings filter on customer_id + created_at range but return
+--   order_id, total_amount and status
+-- - With only (customer_id, created_at) indexed, every match needs a heap
+--   fetch to read those columns (Index Scan)
+-- - INCLUDE stores them in the index leaf pages, so PostgreSQL can answer
+--   with an Index Only Scan
+-- - INCLUDE columns are payload only: they don't change key order or
+--   uniqueness, and can't be used for filtering
+--
+-- INDEX ONLY SCANS NEED VACUUM:
+-- - A heap page is skipped only if the visibility map marks it all-visible
+-- - autovacuum maintains the visibility map, and after bulk loads run
+--   VACUUM (ANALYZE) orders so new pages become all-visible
+--
+-- MIGRATION STRATEGY:
+-- - CONCURRENTLY: no long write lock on orders while the index is rebuilt
+-- - CONCURRENTLY cannot run inside a transaction block (no BEGIN/COMMIT)
+-- - New index is built under a temporary name, then swapped in
+-- - Idempotent: Safe to run multiple times (IF EXISTS / IF NOT EXISTS)
+--
+-- ==============================================================================
+
+-- ==============================================================================
+-- FORWARD MIGRATION (Apply Changes)
+-- ==============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_orders_customer_created_covering
+    ON orders (customer_id, created_at) INCLUDE (order_id, total_amount, status);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_orders_customer_created;
+
+ALTER INDEX IF EXISTS idx_orders_customer_created_covering
+    RENAME TO idx_orders_customer_created;
+
+\echo '✅ Migration 003: idx_orders_customer_created now covers order_id, total_amount, status!'
+
+-- ==============================================================================
+-- ROLLBACK MIGRATION (Revert Changes)
+-- ==============================================================================
+--
+-- To rollback this migration, run:
+--
+-- CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_orders_customer_created_plain
+--     ON orders (customer_id, created_at);
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_orders_customer_created;
+-- ALTER INDEX IF EXISTS idx_orders_customer_created_plain
+--     RENAME TO idx_orders_customer_created;
+--
+-- ==============================================================================
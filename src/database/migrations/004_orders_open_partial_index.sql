@@ -0,0 +1,43 @@
+-- ==============================================================================
+-- MIGRATION 004: Partial index for open (pending/processing) orders
+-- ==============================================================================
+--
+-- Migration: 004_orders_open_partial_index
+-- Description: Add idx_orders_open on (status, created_at) WHERE status IN ('pending', 'processing')
+-- Author: Kafka Food Pipeline
+--
+-- WHY A PARTIAL INDEX?
+-- - "Find orders to retry/finish" filters on status, which had no index,
+--   so every such query was a sequential scan of the whole table
+-- - Most rows end up 'completed' and never match those queries
+-- - Indexing only pending/processing rows keeps the index tiny (and in
+--   RAM). Rows leave the index when their status moves on
+-- - The planner only uses it when the query repeats the predicate:
+--     WHERE status IN ('pending', 'processing') ORDER BY created_at
+--
+-- MIGRATION STRATEGY:
+-- - CONCURRENTLY: no long write lock on orders while the index is built
+-- - CONCURRENTLY cannot run inside a transaction block (no BEGIN/COMMIT)
+-- - Idempotent: Safe to run multiple times (IF NOT EXISTS)
+--
+-- ==============================================================================
+
+-- ==============================================================================
+-- FORWARD MIGRATION (Apply Changes)
+-- ==============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_orders_open
+    ON orders (status, created_at)
+    WHERE status IN ('pending', 'processing');
+
+\echo '✅ Migration 004: idx_orders_open partial index created!'
+
+-- ==============================================================================
+-- ROLLBACK MIGRATION (Revert Changes)
+-- ==============================================================================
+--
+-- To rollback this migration, run:
+--
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_orders_open;
+--
+-- ==============================================================================
@@ -0,0 +1,43 @@
+-- ==============================================================================
+-- MIGRATION 005: Drop redundant idx_orders_customer_id
+-- ==============================================================================
+--
+-- Migration: 005_drop_customer_id_index
+-- Description: Remove the single-column customer_id index
+-- Author: Kafka Food Pipeline
+--
+-- WHY DROP IT?
+-- - customer_id is the leading column of idx_orders_customer_created
+--   (customer_id, created_at), so WHERE customer_id = ? can use that
+--   index's prefix
+-- - The single-column index duplicated work on every INSERT (the consumer
+--   is write-heavy) and took up buffer cache
+--
+-- VERIFY:
+--   EXPLAIN SELECT * FROM orders WHERE customer_id = 'CUST-001';
+--   -> Index Scan / Bitmap Index Scan using idx_orders_customer_created
+--
+-- MIGRATION STRATEGY:
+-- - CONCURRENTLY: doesn't block reads/writes on orders while dropping
+-- - CONCURRENTLY cannot run inside a transaction block (no BEGIN/COMMIT)
+-- - Idempotent: Safe to run multiple times (IF EXISTS)
+--
+-- ==============================================================================
+
+-- ==============================================================================
+-- FORWARD MIGRATION (Apply Changes)
+-- ==============================================================================
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_orders_customer_id;
+
+\echo '✅ Migration 005: idx_orders_customer_id dropped!'
+
+-- ==============================================================================
+-- ROLLBACK MIGRATION (Revert Changes)
+-- ==============================================================================
+--
+-- To rollback this migration, run:
+--
+-- CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_orders_customer_id ON orders(customer_id);
+--
+-- ==============================================================================
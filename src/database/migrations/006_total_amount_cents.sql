@@ -0,0 +1,73 @@
+-- ==============================================================================
+-- MIGRATION 006: Store total_amount as integer cents
+-- ==============================================================================
+--
+-- Migration: 006_total_amount_cents
+-- Description: Replace total_amount DECIMAL(10, 2) with total_amount_cents BIGINT
+-- Author: Kafka Food Pipeline
+--
+-- WHY INTEGER CENTS?
+-- - NUMERIC is variable-length and slow to encode/decode, while BIGINT is a
+--   fixed 8-byte integer (cheaper binary COPY, smaller rows)
+-- - Still exact: 21.47 dollars is stored as 2147, no float rounding
+-- - The positivity CHECK becomes a single integer comparison
+-- - Dollars in SQL: total_amount_cents / 100.0
+--
+-- MIGRATION STRATEGY:
+-- - Single transaction: the column swap is all-or-nothing
+-- - Takes an ACCESS EXCLUSIVE lock on orders while the table is
+--   rewritten: stop the consumers (or run in a quiet window) first
+-- - Dropping total_amount also drops idx_orders_customer_created (it
+--   INCLUDEs the column), so the covering index is rebuilt on the new column
+-- - Not idempotent: run once (the backfill reads total_amount, which
+--   this migration drops)
+--
+-- ==============================================================================
+
+-- ==============================================================================
+-- FORWARD MIGRATION (Apply Changes)
+-- ==============================================================================
+
+BEGIN;
+
+ALTER TABLE orders ADD COLUMN IF NOT EXISTS total_amount_cents BIGINT;
+
+UPDATE orders SET total_amount_cents = ROUND(total_amount * 100);
+
+ALTER TABLE orders ALTER COLUMN total_amount_cents SET NOT NULL;
+
+ALTER TABLE orders
+    ADD CONSTRAINT check_positive_amount CHECK (total_amount_cents > 0);
+
+DROP INDEX IF EXISTS idx_orders_customer_created;
+
+ALTER TABLE orders DROP COLUMN IF EXISTS total_amount;
+
+CREATE INDEX IF NOT EXISTS idx_orders_customer_created ON orders(customer_id, created_at)
+    INCLUDE (order_id, total_amount_cents, status);
+
+COMMENT ON COLUMN orders.total_amount_cents IS
+'Total order amount in cents (2147 = $21.47). Must be > 0.';
+
+COMMIT;
+
+\echo '✅ Migration 006: total_amount replaced by total_amount_cents!'
+
+-- ==============================================================================
+-- ROLLBACK MIGRATION (Revert Changes)
+-- ==============================================================================
+--
+-- To rollback this migration, run:
+--
+-- BEGIN;
+-- ALTER TABLE orders ADD COLUMN total_amount DECIMAL(10, 2);
+-- UPDATE orders SET total_amount = total_amount_cents / 100.0;
+-- ALTER TABLE orders ALTER COLUMN total_amount SET NOT NULL;
+-- ALTER TABLE orders ADD CHECK (total_amount > 0);
+-- DROP INDEX IF EXISTS idx_orders_customer_created;
+-- ALTER TABLE orders DROP COLUMN total_amount_cents;
+-- CREATE INDEX idx_orders_customer_created ON orders(customer_id, created_at)
+--     INCLUDE (order_id, total_amount, status);
+-- COMMIT;
+--
+-- ==============================================================================
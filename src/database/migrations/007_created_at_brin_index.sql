@@ -0,0 +1,49 @@
+-- ==============================================================================
+-- MIGRATION 007: Replace the created_at B-tree with a BRIN index
+-- ==============================================================================
+--
+-- Migration: 007_created_at_brin_index
+-- Description: Swap idx_orders_created_at (B-tree) for idx_orders_created_at_brin
+-- Author: Kafka Food Pipeline
+--
+-- WHY BRIN?
+-- - Orders arrive from Kafka roughly in created_at order, so a row's
+--   position in the table correlates with its created_at
+-- - BRIN stores only the min/max created_at of each block range
+--   (pages_per_range = 32), so it is orders of magnitude smaller than
+--   a B-tree and almost free to maintain on every INSERT
+-- - Range queries ("orders in last hour") read only the block ranges
+--   whose min/max overlap the range
+-- - idx_orders_customer_created stays a B-tree: per-customer lookups
+--   need exact ordering, not block summaries
+--
+-- MIGRATION STRATEGY:
+-- - CONCURRENTLY: no long write lock on orders while indexes change
+-- - CONCURRENTLY cannot run inside a transaction block (no BEGIN/COMMIT)
+-- - BRIN is built before the B-tree is dropped, so time-range queries
+--   keep an index during the whole migration
+-- - Idempotent: Safe to run multiple times (IF EXISTS / IF NOT EXISTS)
+--
+-- ==============================================================================
+
+-- ==============================================================================
+-- FORWARD MIGRATION (Apply Changes)
+-- ==============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_orders_created_at_brin
+    ON orders USING BRIN (created_at) WITH (pages_per_range = 32);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_orders_created_at;
+
+\echo '✅ Migration 007: created_at B-tree replaced by BRIN index!'
+
+-- ==============================================================================
+-- ROLLBACK MIGRATION (Revert Changes)
+-- ==============================================================================
+--
+-- To rollback this migration, run:
+--
+-- CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_orders_created_at ON orders(created_at);
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_orders_created_at_brin;
+--
+-- ==============================================================================
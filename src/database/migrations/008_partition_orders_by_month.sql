@@ -0,0 +1,141 @@
+-- ==============================================================================
+-- MIGRATION 008: Partition orders by month (RANGE on created_at)
+-- ==============================================================================
+--
+-- Migration: 008_partition_orders_by_month
+-- Description: Rebuild orders as a table partitioned by RANGE (created_at)
+-- Author: Kafka Food Pipeline
+--
+-- WHY PARTITION?
+-- - At sustained ingest rates one table (and each of its indexes) grows
+--   without bound; per-month partitions keep every index small, so
+--   INSERTs stay fast
+-- - Time-range queries only scan the months they touch (partition pruning)
+-- - Archiving a month is DETACH PARTITION / DROP TABLE instead of a DELETE
+--
+-- SCHEMA CHANGES:
+-- - PRIMARY KEY (order_id) → PRIMARY KEY (order_id, created_at): unique
+--   constraints on a partitioned table must include the partition key.
+--   Idempotent writes use ON CONFLICT (order_id, created_at); a
+--   redelivered Kafka message has the same created_at, so duplicates are
+--   still skipped
+-- - create_orders_partition(day): creates the monthly partition for a day
+--   (schedule it ahead of each month, see init.sql)
+-- - orders_default: DEFAULT partition for rows without a monthly partition
+--
+-- MIGRATION STRATEGY:
+-- - An existing table cannot be turned into a partitioned table in place:
+--   a new partitioned orders table is created, the rows are copied over,
+--   and the old table is dropped
+-- - Single transaction, ACCESS EXCLUSIVE lock on the old table while rows
+--   are copied: stop the consumers first (they resume from their committed
+--   Kafka offsets afterwards)
+-- - Deploy the consumer version that uses ON CONFLICT (order_id, created_at)
+--   together with this migration
+-- - Not idempotent: run once
+--
+-- ==============================================================================
+
+-- ==============================================================================
+-- FORWARD MIGRATION (Apply Changes)
+-- ==============================================================================
+
+BEGIN;
+
+LOCK TABLE orders IN ACCESS EXCLUSIVE MODE;
+
+ALTER TABLE orders RENAME TO orders_unpartitioned;
+
+CREATE TABLE orders (
+    order_id VARCHAR(50) NOT NULL,
+    customer_id VARCHAR(50) NOT NULL,
+    customer_name VARCHAR(100) NOT NULL,
+    customer_email VARCHAR(100) NOT NULL,
+    items JSONB NOT NULL,
+    total_amount_cents BIGINT NOT NULL
+        CONSTRAINT check_positive_amount CHECK (total_amount_cents > 0),
+    status VARCHAR(20) NOT NULL,
+    created_at TIMESTAMP NOT NULL,
+    processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+) PARTITION BY RANGE (created_at);
+
+CREATE OR REPLACE FUNCTION create_orders_partition(day DATE)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    month_start DATE := date_trunc('month', day)::DATE;
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF orders FOR VALUES FROM (%L) TO (%L)',
+        'orders_' || to_char(month_start, 'YYYY_MM'),
+        month_start,
+        (month_start + INTERVAL '1 month')::DATE
+    );
+END;
+$$;
+
+-- One partition per month that has orders, plus the current and next month
+SELECT create_orders_partition(month::DATE)
+FROM (
+    SELECT DISTINCT date_trunc('month', created_at) AS month FROM orders_unpartitioned
+    UNION
+    SELECT date_trunc('month', CURRENT_DATE)
+    UNION
+    SELECT date_trunc('month', CURRENT_DATE + INTERVAL '1 month')
+) AS months;
+
+CREATE TABLE orders_default PARTITION OF orders DEFAULT;
+
+INSERT INTO orders (
+    order_id, customer_id, customer_name, customer_email, items,
+    total_amount_cents, status, created_at, processed_at
+)
+SELECT
+    order_id, customer_id, customer_name, customer_email, items,
+    total_amount_cents, status, created_at, processed_at
+FROM orders_unpartitioned;
+
+-- Frees the old index names (orders_pkey, idx_orders_*)
+DROP TABLE orders_unpartitioned;
+
+ALTER TABLE orders ADD CONSTRAINT orders_pkey PRIMARY KEY (order_id, created_at);
+
+CREATE INDEX idx_orders_created_at_brin ON orders USING BRIN (created_at)
+    WITH (pages_per_range = 32);
+CREATE INDEX idx_orders_items_gin ON orders USING GIN (items jsonb_path_ops);
+CREATE INDEX idx_orders_customer_created ON orders (customer_id, created_at)
+    INCLUDE (order_id, total_amount_cents, status);
+CREATE INDEX idx_orders_open ON orders (status, created_at)
+    WHERE status IN ('pending', 'processing');
+
+COMMENT ON TABLE orders IS
+'Order records consumed from Kafka food-orders topic. Partitioned by month (created_at).';
+
+COMMIT;
+
+\echo '✅ Migration 008: orders partitioned by month!'
+
+-- ==============================================================================
+-- ROLLBACK MIGRATION (Revert Changes)
+-- ==============================================================================
+--
+-- To rollback this migration, run (consumers stopped):
+--
+-- BEGIN;
+-- ALTER TABLE orders RENAME TO orders_partitioned;
+-- CREATE TABLE orders (LIKE orders_partitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS);
+-- INSERT INTO orders SELECT * FROM orders_partitioned;
+-- DROP TABLE orders_partitioned;
+-- DROP FUNCTION IF EXISTS create_orders_partition(DATE);
+-- ALTER TABLE orders ADD PRIMARY KEY (order_id);
+-- CREATE INDEX idx_orders_created_at_brin ON orders USING BRIN (created_at)
+--     WITH (pages_per_range = 32);
+-- CREATE INDEX idx_orders_items_gin ON orders USING GIN (items jsonb_path_ops);
+-- CREATE INDEX idx_orders_customer_created ON orders (customer_id, created_at)
+--     INCLUDE (order_id, total_amount_cents, status);
+-- CREATE INDEX idx_orders_open ON orders (status, created_at)
+--     WHERE status IN ('pending', 'processing');
+-- COMMIT;
+--
+-- ==============================================================================
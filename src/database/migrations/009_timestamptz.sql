@@ -0,0 +1,134 @@
+-- ==============================================================================
+-- MIGRATION 009: Store created_at / processed_at as TIMESTAMPTZ
+-- ==============================================================================
+--
+-- Migration: 009_timestamptz
+-- Description: Convert created_at and processed_at from TIMESTAMP to TIMESTAMPTZ (UTC)
+-- Author: Kafka Food Pipeline
+--
+-- WHY TIMESTAMPTZ?
+-- - TIMESTAMP (without time zone) stores a wall-clock value: what it means
+--   depends on the session time zone of whoever wrote/reads it
+-- - TIMESTAMPTZ stores an absolute instant (UTC internally); clients get
+--   it back in their zone, Python gets aware datetimes
+-- - Existing values are converted with the session TimeZone, i.e. the
+--   zone the consumers wrote them in (server default, UTC in Docker):
+--   run this migration with the server's default TimeZone
+--
+-- MIGRATION STRATEGY:
+-- - created_at is the partition key, and PostgreSQL cannot change the type
+--   of a partition key column in place: the partitioned table is rebuilt
+--   (same procedure as migration 008)
+-- - Monthly partitions get UTC month boundaries
+-- - Single transaction, ACCESS EXCLUSIVE lock while rows are copied: stop
+--   the consumers first (they resume from their committed Kafka offsets)
+-- - Not idempotent: run once
+--
+-- ==============================================================================
+
+-- ==============================================================================
+-- FORWARD MIGRATION (Apply Changes)
+-- ==============================================================================
+
+BEGIN;
+
+LOCK TABLE orders IN ACCESS EXCLUSIVE MODE;
+
+ALTER TABLE orders RENAME TO orders_timestamp;
+
+-- Old partitions keep their names (orders_YYYY_MM); move them aside
+DO $$
+DECLARE
+    part RECORD;
+BEGIN
+    FOR part IN
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'orders_timestamp'::regclass
+    LOOP
+        EXECUTE format('ALTER TABLE %I RENAME TO %I', part.relname, part.relname || '_old');
+    END LOOP;
+END;
+$$;
+
+CREATE TABLE orders (
+    order_id VARCHAR(50) NOT NULL,
+    customer_id VARCHAR(50) NOT NULL,
+    customer_name VARCHAR(100) NOT NULL,
+    customer_email VARCHAR(100) NOT NULL,
+    items JSONB NOT NULL,
+    total_amount_cents BIGINT NOT NULL
+        CONSTRAINT check_positive_amount CHECK (total_amount_cents > 0),
+    status VARCHAR(20) NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL,
+    processed_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+) PARTITION BY RANGE (created_at);
+
+CREATE OR REPLACE FUNCTION create_orders_partition(day DATE)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    month_start DATE := date_trunc('month', day)::DATE;
+BEGIN
+    -- Bounds are UTC month boundaries, whatever the session time zone
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF orders FOR VALUES FROM (%L) TO (%L)',
+        'orders_' || to_char(month_start, 'YYYY_MM'),
+        month_start::TIMESTAMP AT TIME ZONE 'UTC',
+        (month_start + INTERVAL '1 month')::TIMESTAMP AT TIME ZONE 'UTC'
+    );
+END;
+$$;
+
+-- One partition per month that has orders, plus the current and next month
+SELECT create_orders_partition(month::DATE)
+FROM (
+    SELECT DISTINCT date_trunc('month', created_at) AS month FROM orders_timestamp
+    UNION
+    SELECT date_trunc('month', CURRENT_DATE)
+    UNION
+    SELECT date_trunc('month', CURRENT_DATE + INTERVAL '1 month')
+) AS months;
+
+CREATE TABLE orders_default PARTITION OF orders DEFAULT;
+
+INSERT INTO orders (
+    order_id, customer_id, customer_name, customer_email, items,
+    total_amount_cents, status, created_at, processed_at
+)
+SELECT
+    order_id, customer_id, customer_name, customer_email, items,
+    total_amount_cents, status, created_at, processed_at  -- cast in session TimeZone
+FROM orders_timestamp;
+
+-- Drops the old partitions too, and frees the index names
+DROP TABLE orders_timestamp;
+
+ALTER TABLE orders ADD CONSTRAINT orders_pkey PRIMARY KEY (order_id, created_at);
+
+CREATE INDEX idx_orders_created_at_brin ON orders USING BRIN (created_at)
+    WITH (pages_per_range = 32);
+CREATE INDEX idx_orders_items_gin ON orders USING GIN (items jsonb_path_ops);
+CREATE INDEX idx_orders_customer_created ON orders (customer_id, created_at)
+    INCLUDE (order_id, total_amount_cents, status);
+CREATE INDEX idx_orders_open ON orders (status, created_at)
+    WHERE status IN ('pending', 'processing');
+
+COMMENT ON TABLE orders IS
+'Order records consumed from Kafka food-orders topic. Partitioned by month (created_at).';
+
+COMMIT;
+
+\echo '✅ Migration 009: created_at / processed_at are now TIMESTAMPTZ!'
+
+-- ==============================================================================
+-- ROLLBACK MIGRATION (Revert Changes)
+-- ==============================================================================
+--
+-- Rolling back is the same rebuild in reverse: re-run the FORWARD section
+-- with TIMESTAMP columns and month bounds without AT TIME ZONE (the
+-- INSERT ... SELECT then casts timestamptz → timestamp in the session zone).
+--
+-- ==============================================================================
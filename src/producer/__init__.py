@@ -103,7 +103,7 @@ linger.ms: Wait time before sending batch (default: 0)
     - 0: Send immediately (low latency)
     - >0: Wait for batch to fill (higher throughput)
 
-batch.size: Maximum batch size in bytes (default: 16384)
+batch.size: Maximum batch size in bytes (librdkafka default: 1000000; here 768000)
     - Larger batches = better compression and throughput
     - Smaller batches = lower latency
 
@@ -35,8 +35,10 @@ LEARNING OBJECTIVES:
 """
 
 import argparse
+import logging
 import signal
 import sys
+import threading
 import time
 
 from src.producer.config import ProducerConfig, load_config, validate_kafka_connection
@@ -44,12 +46,23 @@ from src.producer.mock_data import MockDataGenerator
 from src.producer.producer import OrderProducer
 from src.shared.logger import setup_logger
 
+# Length of one production slice: each wake-up produces a slice worth of
+# orders (producer_rate * 0.05, at least 1), then sleeps until the next slice
+_SEND_SLICE_S = 0.05
+
 # ==============================================================================
 # GLOBAL STATE FOR SIGNAL HANDLING
 # ==============================================================================
 # Used for graceful shutdown on Ctrl+C (SIGINT) or SIGTERM
+#
+# WHY AN EVENT (NOT A BOOLEAN FLAG)?
+# - The production loop waits for its next slice with shutdown_event.wait()
+#   instead of time.sleep(): setting the event wakes it immediately
+# - time.sleep() resumes after a signal handler runs, so with a flag the
+#   loop only noticed shutdown after the full interval (up to 1 second at
+#   producer_rate=1)
 
-shutdown_requested = False
+shutdown_event = threading.Event()
 
 
 def signal_handler(signum, frame):
@@ -60,19 +73,19 @@ def signal_handler(signum, frame):
     - User presses Ctrl+C (SIGINT)
     - System sends SIGTERM (e.g., Docker stop)
 
-    It sets a flag to exit the production loop gracefully.
+    It sets shutdown_event to exit the production loop gracefully (waking
+    it if it is waiting for the next slice).
 
     Args:
         signum: Signal number
         frame: Current stack frame
     """
-    global shutdown_requested
     print(f"\n\n⚠️  Shutdown signal received (signal {signum})")
     print("🔄 Gracefully shutting down producer...")
     print("   - Stopping order generation")
     print("   - Flushing pending messages to Kafka")
     print("   - Please wait...\n")
-    shutdown_requested = True
+    shutdown_event.set()
 
 
 # ==============================================================================
@@ -98,14 +111,26 @@ def run_producer(config: ProducerConfig) -> int:
         Exit code (0 = success, 1 = error)
 
     PRODUCTION LOOP:
-    - Generate order
-    - Publish to Kafka
-    - Sleep to maintain rate
+    - Generate a slice of orders
+    - Publish them to Kafka (one produce_orders() call)
+    - Wait (on shutdown_event) to maintain rate
     - Check shutdown flag
     - Repeat until duration or shutdown
-    """
-    global shutdown_requested  # noqa: F824
 
+    RATE LIMITING (batched slices, absolute deadlines):
+    - Each wake-up produces one slice worth of orders: rate * 50 ms
+      (at least 1), e.g. 50 orders at rate=1000, 1 order at rate=10
+    - produce_orders() only enqueues; librdkafka coalesces the slice into
+      few broker requests (linger.ms), so a burst costs no more than a
+      trickle, while sleeping per order costs one timer syscall (and its
+      jitter) per message
+    - Slice deadlines are fixed on the monotonic clock: start,
+      start + batch/rate, ... The loop sleeps only the remaining delay,
+      which absorbs generate/publish time and the wait's oversleep
+    - If the loop falls more than one slice behind (GC pause, broker
+      backpressure), deadlines restart from now instead of bursting to
+      catch up
+    """
     # Set up logger
     logger = setup_logger(
         name=__name__,
@@ -127,8 +152,10 @@ def run_producer(config: ProducerConfig) -> int:
     )
 
     # Validate Kafka connection before starting
+    # (the returned cluster metadata is reused for the topic metadata log)
     logger.info("Validating Kafka connection...")
-    if not validate_kafka_connection(config):
+    cluster_metadata = validate_kafka_connection(config)
+    if cluster_metadata is None:
         logger.error(
             "Cannot connect to Kafka brokers",
             extra={"bootstrap_servers": config.kafka_bootstrap_servers},
@@ -157,15 +184,19 @@ def run_producer(config: ProducerConfig) -> int:
             client_id=config.producer_client_id,
             log_level=config.log_level,
             log_format=config.log_format,
+            compression=config.producer_compression,
+            linger_ms=config.producer_linger_ms,
+            batch_size_bytes=config.producer_batch_size,
+            delivery_report_only_error=config.producer_delivery_report_only_error,
         )
         logger.info("✅ Kafka producer initialized")
     except Exception as e:
         logger.error("Failed to initialize Kafka producer", exc_info=True, extra={"error": str(e)})
         return 1
 
-    # Get topic metadata for informational purposes
-    metadata = producer.get_topic_metadata()
-    if "error" not in metadata:
+    # Get topic metadata for informational purposes (no extra broker round trip)
+    metadata = producer.get_topic_metadata(cluster_metadata)
+    if metadata.get("error") is None:
         logger.info(
             "Topic metadata",
             extra={
@@ -175,79 +206,103 @@ def run_producer(config: ProducerConfig) -> int:
             },
         )
 
-    # Calculate sleep interval for rate limiting
-    # Example: 10 orders/sec → sleep 0.1 sec between orders
-    sleep_interval = 1.0 / config.producer_rate
+    # Hot-loop locals: config values and bound methods are looked up once
+    # here instead of as attribute lookups on every order
+    target_rate = config.producer_rate
+    duration_limit = config.producer_duration
+    generate = generator.generate_order
+    produce = producer.produce_orders
+    monotonic = time.monotonic
+    wait_for_shutdown = shutdown_event.wait
+
+    # Calculate slice size and interval for rate limiting
+    # Example: 1000 orders/sec → 50 orders every 0.05 sec
+    # Example: 10 orders/sec → 1 order every 0.1 sec
+    batch_size = max(1, int(target_rate * _SEND_SLICE_S))
+    sleep_interval = batch_size / target_rate
 
     logger.info(
         "Starting order production",
         extra={
-            "rate": config.producer_rate,
+            "rate": target_rate,
+            "batch_size": batch_size,
             "sleep_interval_ms": sleep_interval * 1000,
-            "duration": config.producer_duration if config.producer_duration > 0 else "infinite",
+            "duration": duration_limit if duration_limit > 0 else "infinite",
         },
     )
 
     # Production loop
     orders_produced = 0
-    start_time = time.time()
+    start_time = monotonic()
+    next_send = start_time  # Deadline of the next slice
     errors = 0
 
+    # Progress logging: the level check is done once (not per log call), and
+    # one extra dict is updated in place instead of rebuilt every 100 orders.
+    # A countdown (decremented per slice) replaces orders_produced % 100
+    progress_countdown = 100
+    progress_enabled = logger.isEnabledFor(logging.INFO)
+    progress_extra = {
+        "orders_produced": 0,
+        "elapsed_seconds": 0.0,
+        "target_rate": target_rate,
+        "actual_rate": 0.0,
+        "errors": 0,
+    }
+
     try:
-        while not shutdown_requested:
+        while not shutdown_event.is_set():
             # Check duration limit (if set)
-            if config.producer_duration > 0:
-                elapsed = time.time() - start_time
-                if elapsed >= config.producer_duration:
+            if duration_limit > 0:
+                elapsed = monotonic() - start_time
+                if elapsed >= duration_limit:
                     logger.info(
                         "Duration limit reached, stopping production",
                         extra={
-                            "duration": config.producer_duration,
+                            "duration": duration_limit,
                             "elapsed": elapsed,
                             "orders_produced": orders_produced,
                         },
                     )
                     break
 
-            # Generate mock order
-            try:
-                order = generator.generate_order()
-            except Exception as e:
-                logger.error("Failed to generate order", exc_info=True, extra={"error": str(e)})
-                errors += 1
-                continue
-
-            # Publish to Kafka
-            try:
-                producer.produce_order(order)
-                orders_produced += 1
-
-                # Log periodic progress (every 100 orders)
-                if orders_produced % 100 == 0:
-                    elapsed = time.time() - start_time
+            # Generate one slice of orders
+            orders = []
+            for _ in range(batch_size):
+                try:
+                    orders.append(generate())
+                except Exception as e:
+                    logger.error("Failed to generate order", exc_info=True, extra={"error": str(e)})
+                    errors += 1
+
+            # Publish the slice to Kafka in one call
+            # (failed orders are logged and skipped by produce_orders)
+            produced = produce(orders)
+            orders_produced += produced
+            errors += len(orders) - produced
+            progress_countdown -= produced
+
+            # Log periodic progress (every 100 orders, at most once per slice)
+            if progress_countdown <= 0:
+                progress_countdown = progress_countdown % 100 or 100
+                if progress_enabled:
+                    elapsed = monotonic() - start_time
                     actual_rate = orders_produced / elapsed if elapsed > 0 else 0
-                    logger.info(
-                        "Production progress",
-                        extra={
-                            "orders_produced": orders_produced,
-                            "elapsed_seconds": round(elapsed, 2),
-                            "target_rate": config.producer_rate,
-                            "actual_rate": round(actual_rate, 2),
-                            "errors": errors,
-                        },
-                    )
-
-            except Exception as e:
-                logger.error(
-                    "Failed to publish order",
-                    exc_info=True,
-                    extra={"correlation_id": order.get("order_id"), "error": str(e)},
-                )
-                errors += 1
-                continue
-
-            # Rate limiting: sleep to maintain target rate
-            time.sleep(sleep_interval)
+                    progress_extra["orders_produced"] = orders_produced
+                    progress_extra["elapsed_seconds"] = round(elapsed, 2)
+                    progress_extra["actual_rate"] = round(actual_rate, 2)
+                    progress_extra["errors"] = errors
+                    logger.info("Production progress", extra=progress_extra)
+
+            # Rate limiting: sleep until the next slice (see RATE LIMITING),
+            # returning early if a shutdown signal arrives meanwhile
+            next_send += sleep_interval
+            delay = next_send - monotonic()
+            if delay > 0:
+                if wait_for_shutdown(delay):
+                    break
+            elif delay < -sleep_interval:
+                next_send = monotonic()  # Too far behind: don't burst
 
     except KeyboardInterrupt:
         # Ctrl+C pressed (already handled by signal handler)
@@ -259,7 +314,7 @@ def run_producer(config: ProducerConfig) -> int:
 
     finally:
         # Graceful shutdown
-        elapsed = time.time() - start_time
+        elapsed = monotonic() - start_time
         actual_rate = orders_produced / elapsed if elapsed > 0 else 0
 
         logger.info(
@@ -405,22 +460,26 @@ def main() -> int:
     config = load_config()
 
     # Override config with CLI arguments (if provided)
+    # (on a copy - load_config() returns a shared cached instance)
+    overrides = {}
     if args.bootstrap_servers:
-        config.kafka_bootstrap_servers = args.bootstrap_servers
+        overrides["kafka_bootstrap_servers"] = args.bootstrap_servers
     if args.topic:
-        config.kafka_topic_orders = args.topic
+        overrides["kafka_topic_orders"] = args.topic
     if args.rate:
-        config.producer_rate = args.rate
+        overrides["producer_rate"] = args.rate
     if args.duration is not None:  # Allow 0
-        config.producer_duration = args.duration
+        overrides["producer_duration"] = args.duration
     if args.client_id:
-        config.producer_client_id = args.client_id
+        overrides["producer_client_id"] = args.client_id
     if args.seed is not None:  # Allow 0
-        config.mock_seed = args.seed
+        overrides["mock_seed"] = args.seed
     if args.log_level:
-        config.log_level = args.log_level
+        overrides["log_level"] = args.log_level
     if args.log_format:
-        config.log_format = args.log_format
+        overrides["log_format"] = args.log_format
+    if overrides:
+        config = config.model_copy(update=overrides)
 
     # Display configuration
     print(config.display_config())
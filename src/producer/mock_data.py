@@ -16,9 +16,9 @@ DATA GENERATION STRATEGY:
 4. Use customer_id as Kafka partition key (ordering per customer)
 
 LIBRARIES USED:
-- Faker: Generate realistic names, emails, phone numbers
-- random: Random selection and number generation
-- datetime: Timestamp generation
+- random: Random selection and number generation, plus customer names,
+  emails and phone numbers drawn from fixed name lists (see FIRST_NAMES)
+- time: Timestamp generation (cached per second, see _now_iso)
 - uuid: Unique order ID generation (alternative to sequential)
 
 LEARNING OBJECTIVES:
@@ -28,11 +28,9 @@ LEARNING OBJECTIVES:
 """
 
 import random
-from datetime import datetime, timezone
+import time
 from typing import Any, Dict, List
 
-from faker import Faker
-
 # ==============================================================================
 # GLOBAL CONFIGURATION
 # ==============================================================================
@@ -41,10 +39,7 @@ from faker import Faker
 # Useful for debugging and consistent test scenarios
 RANDOM_SEED = 42
 
-# Initialize Faker with seed for reproducible fake data
-fake = Faker()
-Faker.seed(RANDOM_SEED)
-random.seed(RANDOM_SEED)
+# Each generator draws from its own random.Random(seed), see __init__
 
 # Number of unique customers (affects partition distribution)
 NUM_CUSTOMERS = 100
@@ -54,7 +49,41 @@ NUM_MENU_ITEMS = 20
 
 # Order ID format: ORD-YYYYMMDD-NNNNN (e.g., ORD-20250110-00001)
 # Includes date for easy identification and 5-digit sequence number
-ORDER_ID_FORMAT = "ORD-{date}-{sequence:05d}"
+# (the "ORD-YYYYMMDD-" prefix is cached per day, see generate_order_id)
+ORDER_ID_PREFIX_FORMAT = "ORD-{date}-"
+
+# Customer name pools: 64 x 64 = 4096 first/last combinations
+#
+# WHY NOT FAKER?
+# - Faker takes ~55-180 ms to import and ~90 us per fake.name(), paid at
+#   every producer start before the first order (and growing linearly with
+#   NUM_CUSTOMERS)
+# - Picking from two fixed tuples with the generator's seeded RNG is
+#   ~3 us per customer, equally reproducible, and needs no dependency
+FIRST_NAMES = (
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
+    "William", "Elizabeth", "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
+    "Thomas", "Sarah", "Charles", "Karen", "Christopher", "Nancy", "Daniel", "Lisa",
+    "Matthew", "Betty", "Anthony", "Margaret", "Mark", "Sandra", "Donald", "Ashley",
+    "Steven", "Kimberly", "Paul", "Emily", "Andrew", "Donna", "Joshua", "Michelle",
+    "Kenneth", "Carol", "Kevin", "Amanda", "Brian", "Melissa", "George", "Deborah",
+    "Timothy", "Stephanie", "Ronald", "Rebecca", "Jason", "Laura", "Edward", "Sharon",
+    "Jeffrey", "Cynthia", "Ryan", "Kathleen", "Jacob", "Amy", "Gary", "Angela",
+)  # fmt: skip
+LAST_NAMES = (
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas",
+    "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson", "White",
+    "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson", "Walker", "Young",
+    "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill", "Flores",
+    "Green", "Adams", "Nelson", "Baker", "Hall", "Rivera", "Campbell", "Mitchell",
+    "Carter", "Roberts", "Gomez", "Phillips", "Evans", "Turner", "Diaz", "Parker",
+    "Cruz", "Edwards", "Collins", "Reyes", "Stewart", "Morris", "Morales", "Murphy",
+)  # fmt: skip
+
+# Lowercase forms for email addresses, computed once instead of per customer
+_FIRST_NAMES_LOWER = tuple(name.lower() for name in FIRST_NAMES)
+_LAST_NAMES_LOWER = tuple(name.lower() for name in LAST_NAMES)
 
 
 # ==============================================================================
@@ -87,6 +116,23 @@ class MockDataGenerator:
         customers: List of 100 unique customer dictionaries
         menu_items: List of 20 food item dictionaries
         order_sequence: Counter for sequential order IDs
+
+    WHY PARALLEL ARRAYS (_cust_*, _item_*)?
+    - generate_order() runs once per message in the producer loop
+    - The customer and menu pools never change after __init__, so the fields
+      an order needs are copied once into flat parallel lists
+    - Per order that leaves index lookups (randrange/sample over indexes)
+      instead of dict lookups and random.choice() over dicts
+    - Prices are kept as integer cents: subtotals and the total are exact
+      integer sums, converted to dollars once at the end
+
+    WHY A PRIVATE random.Random?
+    - Each generator owns its random stream (self._rng), so two generators
+      with the same seed produce the same orders regardless of anything
+      else in the process calling random.* (and this class no longer
+      reseeds the global random module)
+    - generate_order() binds self._rng methods to locals once per call:
+      local name lookups instead of module-global + attribute lookups
     """
 
     def __init__(self, seed: int = RANDOM_SEED):
@@ -97,8 +143,7 @@ class MockDataGenerator:
             seed: Random seed for reproducibility (default: 42)
         """
         self.seed = seed
-        random.seed(seed)
-        Faker.seed(seed)
+        self._rng = random.Random(seed)  # nosec B311 - Safe for demo mock data
 
         # Generate fixed customer pool (100 customers)
         self.customers = self._generate_customers(NUM_CUSTOMERS)
@@ -106,9 +151,30 @@ class MockDataGenerator:
         # Generate fixed menu items (20 items)
         self.menu_items = self._generate_menu_items(NUM_MENU_ITEMS)
 
+        # Flat per-field arrays for generate_order() (see WHY PARALLEL ARRAYS)
+        self._cust_ids = [c["customer_id"] for c in self.customers]
+        self._cust_names = [c["name"] for c in self.customers]
+        self._cust_emails = [c["email"] for c in self.customers]
+        self._item_ids = [m["item_id"] for m in self.menu_items]
+        self._item_names = [m["name"] for m in self.menu_items]
+        self._item_prices = [m["price"] for m in self.menu_items]
+        self._item_prices_cents = [m["price_cents"] for m in self.menu_items]
+        # A list, not a range: random.sample() indexes a list faster
+        self._item_indexes = list(range(len(self.menu_items)))
+        self._num_customers = len(self.customers)
+
         # Order sequence counter for unique order IDs
         self.order_sequence = 0
 
+        # Per-second cache for _now_iso()
+        self._ts_cached_sec = -1
+        self._ts_cached_prefix = ""
+
+        # Per-day cache for generate_order_id(): "ORD-YYYYMMDD-" prefix and the
+        # epoch time (next local midnight) until which it stays valid
+        self._order_id_prefix = ""
+        self._order_id_valid_until = 0.0
+
     def _generate_customers(self, count: int) -> List[Dict[str, str]]:
         """
         Generate a fixed pool of unique customers.
@@ -136,21 +202,26 @@ class MockDataGenerator:
             }
         """
         customers = []
+        randrange = self._rng.randrange
+        randint = self._rng.randint
+        num_first, num_last = len(FIRST_NAMES), len(LAST_NAMES)
 
         for i in range(1, count + 1):
             # Generate customer ID with zero-padded number
             # CUST-00001, CUST-00002, ..., CUST-00100
             customer_id = f"CUST-{i:05d}"
 
-            # Generate realistic personal data using Faker
-            name = fake.name()
+            # Realistic name from the fixed pools (see WHY NOT FAKER?)
+            first = randrange(num_first)  # nosec B311 - Safe for demo mock data
+            last = randrange(num_last)  # nosec B311 - Safe for demo mock data
+            name = f"{FIRST_NAMES[first]} {LAST_NAMES[last]}"
 
             # Email derived from name for consistency
             # "John Doe" → john.doe@example.com
-            email = f"{name.lower().replace(' ', '.')}.{i}@example.com"
+            email = f"{_FIRST_NAMES_LOWER[first]}.{_LAST_NAMES_LOWER[last]}.{i}@example.com"
 
-            # Generate phone number
-            phone = fake.phone_number()
+            # Generate phone number (area code and exchange never start with 0/1)
+            phone = f"+1-{randint(200, 999)}-{randint(200, 999)}-{randint(0, 9999):04d}"  # nosec
 
             customers.append(
                 {"customer_id": customer_id, "name": name, "email": email, "phone": phone}
@@ -182,8 +253,15 @@ class MockDataGenerator:
                 'name': 'Classic Burger',
                 'description': 'Beef patty with lettuce, tomato, and cheese',
                 'price': 8.99,
+                'price_cents': 899,
                 'category': 'Burgers'
             }
+
+        WHY price_cents?
+        - Floats can't represent most cent amounts exactly (8.99 * 3 is
+          26.970000000000002), so float subtotals need a round() per item
+        - Integer cents multiply and sum exactly; dollars are produced by a
+          single division when the order is built
         """
         # Predefined menu items for realistic variety
         # Format: (name, description, price, category)
@@ -218,6 +296,7 @@ class MockDataGenerator:
                     "name": name,
                     "description": description,
                     "price": price,
+                    "price_cents": round(price * 100),
                     "category": category,
                 }
             )
@@ -241,7 +320,7 @@ class MockDataGenerator:
         - This is NOT cryptographic random - only used for mock data generation
         - For production security-sensitive operations, use secrets.SystemRandom() instead
         """
-        return random.choice(self.customers)  # nosec B311 - Safe for demo mock data
+        return self._rng.choice(self.customers)  # nosec B311 - Safe for demo mock data
 
     def get_random_menu_items(self, min_items: int = 1, max_items: int = 5) -> List[Dict[str, Any]]:
         """
@@ -274,18 +353,18 @@ class MockDataGenerator:
         - For production security-sensitive operations, use secrets.SystemRandom() instead
         """
         # Random number of items in order
-        num_items = random.randint(min_items, max_items)  # nosec B311 - Safe for demo mock data
+        num_items = self._rng.randint(min_items, max_items)  # nosec B311 - Safe for demo mock data
 
         # Randomly select items (without replacement to avoid duplicates)
-        selected_items = random.sample(  # nosec B311 - Safe for demo mock data
+        selected_items = self._rng.sample(  # nosec B311 - Safe for demo mock data
             self.menu_items, num_items
         )
 
-        # Add quantity and calculate subtotal
+        # Add quantity and calculate subtotal (exact, in integer cents)
         order_items = []
         for item in selected_items:
-            quantity = random.randint(1, 3)  # nosec B311 - Safe for demo mock data
-            subtotal = round(item["price"] * quantity, 2)
+            quantity = self._rng.randint(1, 3)  # nosec B311 - Safe for demo mock data
+            subtotal = item["price_cents"] * quantity / 100
 
             order_items.append(
                 {
@@ -315,10 +394,52 @@ class MockDataGenerator:
         - NNNNN: Sequential number (5 digits, supports 99,999 orders/day)
         - Human-readable: Easy to communicate ("order 12345")
         - Sortable: Chronological ordering by ID
+
+        WHY CACHE THE PREFIX?
+        - The date part changes once per day, but this runs once per order
+        - "ORD-YYYYMMDD-" is formatted only when the local day rolls over;
+          every other call is one time.time() check, an increment and an
+          f-string (~0.4 us vs ~2.7 us for datetime.now().strftime())
         """
+        now = time.time()
+        if now >= self._order_id_valid_until:
+            local = time.localtime(now)
+            self._order_id_prefix = ORDER_ID_PREFIX_FORMAT.format(
+                date=time.strftime("%Y%m%d", local)
+            )
+            # Next local midnight (mktime normalizes day overflow and DST)
+            self._order_id_valid_until = time.mktime(
+                (local.tm_year, local.tm_mon, local.tm_mday + 1, 0, 0, 0, 0, 0, -1)
+            )
+
         self.order_sequence += 1
-        today = datetime.now().strftime("%Y%m%d")
-        return ORDER_ID_FORMAT.format(date=today, sequence=self.order_sequence)
+        return f"{self._order_id_prefix}{self.order_sequence:05d}"
+
+    def _now_iso(self) -> str:
+        """
+        Current UTC time as ISO 8601 with milliseconds.
+
+        Format: YYYY-MM-DDTHH:MM:SS.mmmZ
+        Example: 2025-01-10T14:30:00.123Z
+
+        Returns:
+            Timestamp string
+
+        WHY CACHE THE SECOND?
+        - Called once per order; at 1000+ orders/sec most calls fall in the
+          same second as the previous one
+        - The "YYYY-MM-DDTHH:MM:SS" prefix is formatted only when the second
+          changes; other calls just append the milliseconds
+        - time.time() avoids building a datetime object per order
+          (~0.6 us vs ~1.5 us for datetime.now().isoformat())
+        """
+        t = time.time()
+        sec = int(t)
+        if sec != self._ts_cached_sec:
+            self._ts_cached_sec = sec
+            self._ts_cached_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        ms = int((t - sec) * 1000)
+        return f"{self._ts_cached_prefix}.{ms:03d}Z"
 
     def generate_order(self) -> Dict[str, Any]:
         """
@@ -355,7 +476,7 @@ class MockDataGenerator:
         }
 
         KAFKA PUBLISHING:
-        - Serialize to JSON: json.dumps(order)
+        - Serialize to JSON: orjson.dumps(order) (see OrderProducer.produce_order)
         - Partition key: order['customer_id']
         - Value: JSON bytes
 
@@ -369,25 +490,51 @@ class MockDataGenerator:
             >>> order['status']
             'pending'
         """
-        # Get random customer (partition key for Kafka)
-        customer = self.get_random_customer()
+        # Same distributions as get_random_customer() / get_random_menu_items()
+        # (uniform customer, 1-5 distinct items, quantity 1-3), drawn from
+        # self._rng over indexes into the parallel arrays built in __init__;
+        # the random sequence is not the same as those helpers' or Faker's
+        # (random() scaled to an index: cheaper than randint/randrange per call)
+        rng = self._rng
+        rnd = rng.random
+        sample = rng.sample
+        prices_cents = self._item_prices_cents
+        item_ids = self._item_ids
+        item_names = self._item_names
+        item_prices = self._item_prices
 
-        # Generate random order items
-        items = self.get_random_menu_items(min_items=1, max_items=5)
-
-        # Calculate total amount from items
-        total_amount = sum(item["subtotal"] for item in items)
-        total_amount = round(total_amount, 2)
+        # Get random customer (partition key for Kafka)
+        c = int(rnd() * self._num_customers)  # nosec B311 - Safe for demo mock data
+
+        # Generate random order items (1-5 distinct items, quantity 1-3 each),
+        # subtotals and total in integer cents (exact), dollars only at the end
+        num_items = int(rnd() * 5) + 1  # nosec B311 - Safe for demo mock data
+        items = []
+        total_cents = 0
+        for j in sample(self._item_indexes, num_items):  # nosec B311
+            quantity = int(rnd() * 3) + 1  # nosec B311 - Safe for demo mock data
+            subtotal_cents = prices_cents[j] * quantity
+            total_cents += subtotal_cents
+            items.append(
+                {
+                    "item_id": item_ids[j],
+                    "name": item_names[j],
+                    "quantity": quantity,
+                    "price": item_prices[j],
+                    "subtotal": subtotal_cents / 100,
+                }
+            )
+        total_amount = total_cents / 100
 
         # Generate timestamp (ISO 8601 format for consistency)
-        created_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        created_at = self._now_iso()
 
         # Build complete order
         order = {
             "order_id": self.generate_order_id(),
-            "customer_id": customer["customer_id"],  # PARTITION KEY!
-            "customer_name": customer["name"],
-            "customer_email": customer["email"],
+            "customer_id": self._cust_ids[c],  # PARTITION KEY!
+            "customer_name": self._cust_names[c],
+            "customer_email": self._cust_emails[c],
             "items": items,
             "total_amount": total_amount,
             "status": "pending",  # Initial status
@@ -437,12 +584,13 @@ order2 = gen2.generate_order()
 assert order1['customer_id'] == order2['customer_id']  # Same customer!
 
 # Integration with Kafka producer
+# (the pipeline itself uses OrderProducer, which encodes with orjson too)
 from kafka import KafkaProducer
-import json
+import orjson
 
 producer = KafkaProducer(
     bootstrap_servers='localhost:9092',
-    value_serializer=lambda v: json.dumps(v).encode('utf-8')
+    value_serializer=orjson.dumps  # dict → JSON bytes in one C call
 )
 
 generator = MockDataGenerator()
@@ -32,13 +32,28 @@ BLOCKCHAIN ANALOGY:
 - Flush = Wait for finality (all confirmations received)
 """
 
-import json
+import logging
+import threading
+import time
+from collections.abc import Iterable
 from typing import Any, Callable, Dict, Optional
 
+import orjson
 from confluent_kafka import KafkaError, KafkaException, Producer
 
 from src.shared.logger import setup_logger
 
+# flush() drains in steps of this many seconds, logging progress in between
+_FLUSH_STEP_S = 1.0
+
+# Background poll thread: max seconds each poll() blocks waiting for events
+_POLL_TIMEOUT_S = 0.1
+
+# produce_orders(): on a full local queue, wait up to this many seconds for
+# the poll thread to serve delivery reports (frees queue space), then retry
+# the order once
+_BUFFER_FULL_WAIT_S = 1.0
+
 # ==============================================================================
 # KAFKA PRODUCER CLASS
 # ==============================================================================
@@ -55,6 +70,15 @@ class OrderProducer:
     - Delivery callbacks and error handling
     - Graceful shutdown
 
+    WHY A BACKGROUND POLL THREAD?
+    - Delivery callbacks only run inside poll()/flush()
+    - Calling poll(0) after every produce() adds a C call per message
+      (~0.3 us) on the hot path, and nothing is polled while the
+      production loop waits for its next slice
+    - A daemon thread blocking in poll(0.1) serves callbacks as soon as
+      reports arrive; librdkafka releases the GIL while it waits, so the
+      thread costs nothing when idle
+
     Attributes:
         bootstrap_servers: Kafka broker addresses (e.g., "localhost:9092")
         topic: Kafka topic name (e.g., "food-orders")
@@ -71,6 +95,10 @@ class OrderProducer:
         delivery_callback: Optional[Callable] = None,
         log_level: str = "INFO",
         log_format: str = "json",
+        compression: str = "zstd",
+        linger_ms: int = 50,
+        batch_size_bytes: int = 768000,
+        delivery_report_only_error: bool = False,
     ):
         """
         Initialize Kafka producer.
@@ -82,6 +110,10 @@ class OrderProducer:
             delivery_callback: Optional custom callback for delivery reports
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
             log_format: Log format ("json" or "text")
+            compression: Batch compression codec (none, gzip, snappy, lz4, zstd)
+            linger_ms: How long librdkafka waits to fill a batch (milliseconds)
+            batch_size_bytes: Max bytes per partition batch (one ProduceRequest entry)
+            delivery_report_only_error: Only invoke delivery_callback for failed messages
 
         Raises:
             KafkaException: If producer initialization fails
@@ -118,10 +150,18 @@ class OrderProducer:
             # === PERFORMANCE ===
             # Compression reduces network bandwidth and storage
             # Options: none, gzip, snappy, lz4, zstd
-            "compression.type": "snappy",
+            # zstd (librdkafka default level 3) compresses repetitive JSON
+            # batches far better than snappy at similar producer CPU; the
+            # broker keeps the producer's codec (compression.type=producer)
+            "compression.type": compression,
             # Batching parameters
-            "linger.ms": 10,  # Wait 10ms to batch messages (throughput vs latency)
+            # A batch is sent when it reaches batch.num.messages OR batch.size
+            # bytes OR linger.ms, whichever comes first. 50 ms lets a whole
+            # rate-limiter slice share one request per partition; fewer,
+            # larger batches also compress better
+            "linger.ms": linger_ms,  # Wait to batch messages (throughput vs latency)
             "batch.num.messages": 10000,  # Batch up to 10k messages
+            "batch.size": batch_size_bytes,  # ...or this many bytes
             # === ERROR HANDLING ===
             # Retries on transient failures (idempotence sets this to INT_MAX)
             "retry.backoff.ms": 100,  # Wait 100ms between retries
@@ -129,6 +169,10 @@ class OrderProducer:
             "request.timeout.ms": 30000,  # 30 seconds
             # Max in-flight requests (idempotence allows up to 5)
             "max.in.flight.requests.per.connection": 5,
+            # Delivery reports for successful messages are optional: with
+            # this set, librdkafka drops them instead of queueing one per
+            # message for the poll thread (failures are still reported)
+            "delivery.report.only.error": delivery_report_only_error,
         }
 
         # Initialize producer
@@ -150,6 +194,33 @@ class OrderProducer:
             )
             raise
 
+        # Serve delivery callbacks off the produce path (see WHY A BACKGROUND
+        # POLL THREAD?); stopped by close(). _delivered is set each time a
+        # poll() served events, for produce_orders() to wait on when the
+        # queue is full - the poll thread stays the only one serving callbacks
+        self._poll_stop = threading.Event()
+        self._delivered = threading.Event()
+        self._poll_thread = threading.Thread(
+            target=self._poll_loop, name="kafka-producer-poll", daemon=True
+        )
+        self._poll_thread.start()
+
+    def _poll_loop(self) -> None:
+        """Poll for delivery reports until close() sets the stop event."""
+        while not self._poll_stop.is_set():
+            try:
+                if self.producer.poll(_POLL_TIMEOUT_S):
+                    self._delivered.set()
+            except Exception as e:
+                # An exception raised inside a delivery callback surfaces
+                # here; keep serving the remaining callbacks
+                self._delivered.set()
+                self.logger.error(
+                    "Error while polling for delivery reports",
+                    exc_info=True,
+                    extra={"error": str(e)},
+                )
+
     def _default_delivery_callback(self, err: Optional[KafkaError], msg) -> None:
         """
         Default callback for message delivery reports.
@@ -214,7 +285,7 @@ class OrderProducer:
         """
         try:
             if msg and msg.value():
-                order_data = json.loads(msg.value().decode("utf-8"))
+                order_data = orjson.loads(msg.value())
                 return order_data.get("order_id")
         except Exception:
             pass
@@ -228,7 +299,7 @@ class OrderProducer:
         1. Serializes order to JSON bytes
         2. Uses customer_id as partition key (ensures ordering)
         3. Sends asynchronously to Kafka
-        4. Polls for delivery callbacks
+           (delivery callbacks are served by the background poll thread)
 
         Args:
             order: Order dictionary with structure:
@@ -269,37 +340,40 @@ class OrderProducer:
 
         try:
             # Serialize order to JSON bytes
-            # Kafka messages are always bytes
-            value_bytes = json.dumps(order).encode("utf-8")
+            # Kafka messages are always bytes; orjson encodes straight to
+            # UTF-8 bytes (no str + .encode() step) and is several times
+            # faster than json.dumps for these nested order dicts
+            value_bytes = orjson.dumps(order)
 
-            # Partition key as bytes
+            # Partition key
             # Kafka uses key to determine partition: hash(key) % num_partitions
-            key_bytes = customer_id.encode("utf-8")
+            # produce() accepts a str key and UTF-8 encodes it in C, so no
+            # Python-level .encode() per message
 
             # Asynchronous send (non-blocking)
             # Message goes to internal buffer, sent in background
+            # topic, value and key are positional: produce(topic, value, key)
+            # parses keyword arguments noticeably slower (~0.3 us per call)
             self.producer.produce(
-                topic=self.topic,
-                key=key_bytes,  # Partition key (customer_id)
-                value=value_bytes,  # Order data (JSON)
+                self.topic,
+                value_bytes,  # Order data (JSON)
+                customer_id,  # Partition key (customer_id)
                 on_delivery=self.delivery_callback,  # Callback when delivered
             )
 
-            # Poll for delivery callbacks
-            # Triggers callbacks for previously sent messages
-            # poll(0) = non-blocking check
-            self.producer.poll(0)
-
-            self.logger.debug(
-                "Order published to Kafka",
-                extra={
-                    "correlation_id": order_id,
-                    "customer_id": customer_id,
-                    "topic": self.topic,
-                    "total_amount": order.get("total_amount"),
-                    "items_count": len(order.get("items", [])),
-                },
-            )
+            # Level check first: extra={...} would otherwise be built for
+            # every order even though DEBUG is normally filtered out
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Order published to Kafka",
+                    extra={
+                        "correlation_id": order_id,
+                        "customer_id": customer_id,
+                        "topic": self.topic,
+                        "total_amount": order.get("total_amount"),
+                        "items_count": len(order.get("items", [])),
+                    },
+                )
 
         except BufferError as e:
             # Producer buffer full - backpressure!
@@ -340,6 +414,94 @@ class OrderProducer:
             )
             raise
 
+    def produce_orders(self, orders: Iterable[dict[str, Any]]) -> int:
+        """
+        Publish a batch of food orders to Kafka topic.
+
+        Same message format, partition key and delivery callback as
+        produce_order(), but one call covers many orders. A failed order is
+        logged and skipped; the rest of the batch is still published.
+
+        BACKPRESSURE (BufferError, local queue full):
+        - The order is retried once after the background poll thread has
+          served delivery reports, which frees queue space (waits at most
+          _BUFFER_FULL_WAIT_S); the wait also slows this loop down to the
+          rate the brokers accept
+        - It waits on the poll thread instead of calling poll() itself, so
+          delivery callbacks never run on two threads at once
+        - If the queue is still full the order is DROPPED (logged with its
+          traceback) and not counted; run_producer() reports it as an error.
+          Unlike produce_order(), the batch is not aborted by re-raising
+
+        Args:
+            orders: Order dictionaries (see produce_order for the structure)
+
+        Returns:
+            Number of orders handed to librdkafka (failed orders excluded)
+
+        WHY A BATCH API?
+        - produce_order() pays per-call Python overhead: attribute lookups,
+          exception-handler setup, the DEBUG level check
+        - Here the bound methods are looked up once per batch and the loop
+          body is validation + orjson.dumps + a positional produce()
+        - librdkafka batches on its side anyway (linger.ms), so handing it
+          a whole rate-limiter slice at once loses nothing
+
+        Example:
+            >>> orders = [generator.generate_order() for _ in range(50)]
+            >>> sent = producer.produce_orders(orders)
+            >>> failed = len(orders) - sent
+        """
+        produce = self.producer.produce
+        topic = self.topic
+        on_delivery = self.delivery_callback
+        dumps = orjson.dumps
+        log_each = self.logger.isEnabledFor(logging.DEBUG)
+
+        produced = 0
+        for order in orders:
+            try:
+                customer_id = order["customer_id"]  # Partition key
+                if "order_id" not in order:
+                    raise ValueError("Order missing 'order_id' field")
+                value = dumps(order)
+                try:
+                    produce(topic, value, customer_id, on_delivery=on_delivery)
+                except BufferError:
+                    # Local queue full - backpressure: wait for the poll
+                    # thread to serve deliveries, then retry this order once
+                    self._delivered.clear()
+                    self._delivered.wait(_BUFFER_FULL_WAIT_S)
+                    produce(topic, value, customer_id, on_delivery=on_delivery)
+                produced += 1
+                if log_each:
+                    self.logger.debug(
+                        "Order published to Kafka",
+                        extra={"correlation_id": order["order_id"], "customer_id": customer_id},
+                    )
+
+            except BufferError as e:
+                # Still full after the retry: drop the order (see BACKPRESSURE)
+                self.logger.error(
+                    "Producer buffer full, order dropped",
+                    exc_info=True,
+                    extra={
+                        "correlation_id": order.get("order_id"),
+                        "error": str(e),
+                        "advice": "Slow down production or increase buffer.memory",
+                    },
+                )
+
+            except Exception as e:
+                # Missing key, serialization or Kafka client error
+                self.logger.error(
+                    "Failed to publish order",
+                    exc_info=True,
+                    extra={"correlation_id": order.get("order_id"), "error": str(e)},
+                )
+
+        return produced
+
     def flush(self, timeout: float = 30.0) -> int:
         """
         Wait for all pending messages to be delivered.
@@ -360,6 +522,13 @@ class OrderProducer:
         - End of batch: Wait for confirmations
         - Critical messages: Verify delivery
 
+        WHY DRAIN IN STEPS?
+        - flush() is for shutdown only: produce_order() never flushes or
+          polls; the background poll thread serves delivery callbacks
+        - One flush(30) gives no sign of life for up to 30 seconds; flushing
+          in 1-second steps logs the pending count while the queue drains
+          and returns as soon as it is empty
+
         BLOCKCHAIN ANALOGY:
         - Flush = Wait for transaction finality
         - Returns 0 = All transactions confirmed on-chain
@@ -375,7 +544,17 @@ class OrderProducer:
         self.logger.info("Flushing producer buffer", extra={"timeout": timeout})
 
         # Flush blocks until all messages delivered or timeout
-        remaining = self.producer.flush(timeout=timeout)
+        deadline = time.monotonic() + timeout
+        remaining = self.producer.flush(timeout=min(_FLUSH_STEP_S, timeout))
+        while remaining > 0:
+            time_left = deadline - time.monotonic()
+            if time_left <= 0:
+                break
+            self.logger.info(
+                "Waiting for delivery reports",
+                extra={"remaining_messages": remaining, "seconds_left": round(time_left, 1)},
+            )
+            remaining = self.producer.flush(timeout=min(_FLUSH_STEP_S, time_left))
 
         if remaining > 0:
             self.logger.warning(
@@ -397,8 +576,9 @@ class OrderProducer:
 
         This method:
         1. Flushes pending messages
-        2. Closes producer connection
-        3. Releases resources
+        2. Stops the background poll thread
+        3. Closes producer connection
+        4. Releases resources
 
         Args:
             timeout: Maximum time to wait for flush (seconds)
@@ -415,6 +595,10 @@ class OrderProducer:
         # Flush pending messages
         remaining = self.flush(timeout=timeout)
 
+        # Stop the poll thread (it exits within one poll timeout)
+        self._poll_stop.set()
+        self._poll_thread.join(timeout=5.0)
+
         if remaining > 0:
             self.logger.error(
                 f"Producer closed with {remaining} messages undelivered",
@@ -423,7 +607,7 @@ class OrderProducer:
 
         self.logger.info("Producer shutdown complete")
 
-    def get_topic_metadata(self) -> Dict[str, Any]:
+    def get_topic_metadata(self, cluster_metadata=None) -> Dict[str, Any]:
         """
         Get metadata about the target topic.
 
@@ -432,8 +616,12 @@ class OrderProducer:
         - Replication factor
         - Leader for each partition
 
+        Args:
+            cluster_metadata: ClusterMetadata from an earlier list_topics()
+                call (e.g. validate_kafka_connection); None fetches it
+
         Returns:
-            Dictionary with topic metadata
+            Dictionary with topic metadata ("error" is None on success)
 
         Example:
             >>> producer = OrderProducer("localhost:9092", "food-orders")
@@ -441,8 +629,10 @@ class OrderProducer:
             >>> print(f"Topic has {len(metadata['partitions'])} partitions")
         """
         try:
-            # Get cluster metadata
-            metadata = self.producer.list_topics(topic=self.topic, timeout=10)
+            # Get cluster metadata (unless the caller already has it)
+            metadata = cluster_metadata
+            if metadata is None:
+                metadata = self.producer.list_topics(topic=self.topic, timeout=10)
 
             topic_metadata = metadata.topics.get(self.topic)
             if not topic_metadata:
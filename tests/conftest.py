@@ -48,7 +48,7 @@ def postgres_container() -> Generator[PostgresContainer, None, None]:
         def test_something(postgres_container):
             db_url = postgres_container.get_connection_url()
     """
-    with PostgresContainer("postgres:15") as postgres:
+    with PostgresContainer("postgres:15", driver="psycopg") as postgres:
         # Wait for PostgreSQL to be ready
         postgres.get_connection_url()
         yield postgres
@@ -23,10 +23,12 @@ from decimal import Decimal
 
 import pytest
 from confluent_kafka import Producer
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import DataError, IntegrityError
 from sqlalchemy.orm import sessionmaker
 
 from src.consumer.consumer import OrderConsumer
+from src.consumer.database import DatabaseManager
 from src.consumer.models import Order
 
 # ==============================================================================
@@ -216,6 +218,56 @@ def test_duplicate_message_handling(consumer_config, kafka_container, sample_ord
     consumer.close()
 
 
+@pytest.mark.integration
+def test_create_orders_partition_is_idempotent(db_session):
+    """Test create_orders_partition() can run repeatedly (every replica, every hour)."""
+    first = Order.create_partitions(db_session)
+    db_session.commit()
+
+    # Second run for the same months must be a no-op, not an error
+    second = Order.create_partitions(db_session)
+    db_session.execute(text("SELECT create_orders_partition(CURRENT_DATE)"))
+    db_session.commit()
+
+    partitions = set(
+        db_session.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'orders'::regclass"
+            )
+        ).scalars()
+    )
+    assert second == first
+    assert set(first) | {"orders_default"} == partitions
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "override, error",
+    [
+        ({"customer_id": "C" * 80}, DataError),  # VARCHAR(50)
+        ({"total_amount_cents": 0}, IntegrityError),  # check_positive_amount
+    ],
+)
+def test_bulk_copy_bad_row_raises_sqlalchemy_error(
+    db_session, consumer_config, sample_order_data, override, error
+):
+    """Test a row the orders table rejects surfaces as the SQLAlchemy error class."""
+    db_manager = DatabaseManager(consumer_config)
+    good = Order.row_from_kafka_message(sample_order_data)
+    bad = dict(good, order_id="ORD-BAD", **override)
+
+    try:
+        with pytest.raises(error):
+            db_manager.bulk_copy_orders([good, bad])
+
+        # Whole batch rolled back; the good row alone still loads
+        assert db_manager.bulk_copy_orders([good]) == 1
+    finally:
+        db_manager.close()
+
+
 # ==============================================================================
 # DATABASE PERSISTENCE TESTS
 # ==============================================================================
@@ -38,7 +38,7 @@ def test_producer_config_defaults():
     # Producer settings defaults
     assert config.producer_rate == 10
     assert config.producer_duration == 60
-    assert config.producer_compression == "snappy"
+    assert config.producer_compression == "zstd"
 
     # Mock data defaults
     assert config.mock_seed == 42
@@ -117,6 +117,15 @@ def test_producer_config_get_kafka_config():
     assert kafka_config["bootstrap.servers"] == "localhost:9092"
     assert "client.id" in kafka_config
     assert kafka_config["client.id"] == "test-producer"
+    assert kafka_config["delivery.report.only.error"] is False
+
+
+@pytest.mark.unit
+def test_producer_config_delivery_report_only_error():
+    """Test delivery.report.only.error is passed through to librdkafka."""
+    config = ProducerConfig(producer_delivery_report_only_error=True)
+
+    assert config.get_kafka_config()["delivery.report.only.error"] is True
 
 
 @pytest.mark.unit
@@ -128,7 +137,10 @@ def test_producer_config_from_env(monkeypatch):
     monkeypatch.setenv("PRODUCER_RATE", "50")
     monkeypatch.setenv("LOG_LEVEL", "DEBUG")
 
+    # load_config() is cached; drop any instance built before monkeypatching
+    load_producer_config.cache_clear()
     config = load_producer_config()
+    load_producer_config.cache_clear()
 
     assert config.kafka_bootstrap_servers == "kafka:29092"
     assert config.kafka_topic_orders == "env-orders"
@@ -280,6 +292,20 @@ def test_consumer_config_get_kafka_config():
     assert kafka_config["enable.auto.commit"] is False
 
 
+@pytest.mark.unit
+def test_consumer_config_get_kafka_config_fetch_tuning():
+    """Test fetch tuning settings are passed through to librdkafka."""
+    config = ConsumerConfig(fetch_min_bytes=1024, fetch_wait_max_ms=50)
+
+    kafka_config = config.get_kafka_config()
+
+    assert kafka_config["fetch.min.bytes"] == 1024
+    assert kafka_config["fetch.wait.max.ms"] == 50
+    assert kafka_config["max.partition.fetch.bytes"] == config.max_partition_fetch_bytes
+    assert kafka_config["queued.max.messages.kbytes"] == config.queued_max_messages_kbytes
+    assert kafka_config["enable.partition.eof"] is False
+
+
 @pytest.mark.unit
 def test_consumer_config_get_database_url():
     """Test get_database_url() helper method."""
@@ -294,7 +320,7 @@ def test_consumer_config_get_database_url():
     db_url = config.get_database_url()
 
     # Should be valid PostgreSQL URL
-    assert db_url.startswith("postgresql://")
+    assert db_url.startswith("postgresql+psycopg://")
     assert "testuser" in db_url
     assert "testpass" in db_url
     assert "db.example.com" in db_url
@@ -314,7 +340,10 @@ def test_consumer_config_from_env(monkeypatch):
     monkeypatch.setenv("MAX_RETRIES", "5")
     monkeypatch.setenv("LOG_LEVEL", "DEBUG")
 
+    # load_config() is cached; drop any instance built before monkeypatching
+    load_consumer_config.cache_clear()
     config = load_consumer_config()
+    load_consumer_config.cache_clear()
 
     assert config.kafka_bootstrap_servers == "kafka:29092"
     assert config.consumer_group_id == "env-group"
@@ -0,0 +1,324 @@
+"""
+Unit Tests for Order Consumer
+
+Tests OrderConsumer batching and offset commits against a mocked
+confluent_kafka.Consumer and a stub database writer.
+These are unit tests that don't require Kafka or a database.
+
+TEST STRATEGY:
+- Test offsets are committed only after a successful batch write
+- Test the committed offset is max(offset) + 1 per partition
+- Test a failed write drops pending state and commits nothing
+- Test a row rejected by the database is isolated and skipped
+- Test the revoke callback flushes synchronously
+- Test poison messages (msgspec DecodeError / ValidationError) are skipped,
+  including values that don't fit the orders table
+"""
+
+import math
+from unittest.mock import MagicMock
+
+import msgspec
+import orjson
+import pytest
+from sqlalchemy.exc import DataError, IntegrityError, OperationalError
+
+from src.consumer import consumer as consumer_module
+from src.consumer.config import ConsumerConfig
+from src.consumer.consumer import OrderConsumer, _WriteResult
+from src.consumer.models import Order, amount_to_cents
+
+
+def make_message(value, offset, partition=0, topic="food-orders"):
+    """Build a mocked Kafka message with the accessors the consumer uses."""
+    msg = MagicMock()
+    msg.value.return_value = value
+    msg.topic.return_value = topic
+    msg.partition.return_value = partition
+    msg.offset.return_value = offset
+    msg.error.return_value = None
+    return msg
+
+
+def committed_offsets(mock_kafka_consumer):
+    """Return {(topic, partition): offset} for every commit() call, in order."""
+    return [
+        {(tp.topic, tp.partition): tp.offset for tp in c.kwargs["offsets"]}
+        for c in mock_kafka_consumer.commit.call_args_list
+    ]
+
+
+@pytest.fixture
+def mock_kafka_consumer(monkeypatch):
+    """Replace confluent_kafka.Consumer with a MagicMock; returns the instance."""
+    kafka_consumer = MagicMock()
+    monkeypatch.setattr(consumer_module, "Consumer", MagicMock(return_value=kafka_consumer))
+    return kafka_consumer
+
+
+@pytest.fixture
+def db_writer():
+    """Stub batch writer: reports every order in the batch as inserted."""
+    return MagicMock(side_effect=lambda batch: _WriteResult(len(batch), 0))
+
+
+@pytest.fixture
+def db_manager():
+    """Stub DatabaseManager: bulk_copy_orders() reports every row inserted."""
+    manager = MagicMock()
+    manager.bulk_copy_orders.side_effect = lambda rows: len(rows)
+    return manager
+
+
+@pytest.fixture
+def order_consumer(mock_kafka_consumer, db_manager, db_writer):
+    """OrderConsumer wired to the mocked Kafka client and the stub writer."""
+    consumer = OrderConsumer(ConsumerConfig(), db_manager)
+    # Replaces the DB write (and its retries) that runs on the writer thread
+    consumer._write_batch_with_retry = db_writer
+    yield consumer
+    consumer._writer.shutdown(wait=True)
+
+
+@pytest.fixture
+def order_value(sample_order_data):
+    """Serialized valid order message."""
+    return orjson.dumps(sample_order_data)
+
+
+# ==============================================================================
+# OFFSET COMMIT TESTS
+# ==============================================================================
+
+
+@pytest.mark.unit
+def test_commit_after_successful_write(order_consumer, mock_kafka_consumer, db_writer, order_value):
+    """Test offsets are committed once the batch is written, as offset + 1."""
+    for partition, offset in [(0, 5), (0, 6), (0, 7), (1, 3)]:
+        order_consumer._process_message(make_message(order_value, offset, partition))
+
+    # Buffered only: nothing written or committed yet
+    db_writer.assert_not_called()
+    mock_kafka_consumer.commit.assert_not_called()
+
+    order_consumer._flush_batch(asynchronous=False)
+
+    assert len(db_writer.call_args.args[0]) == 4
+    assert committed_offsets(mock_kafka_consumer) == [
+        {("food-orders", 0): 8, ("food-orders", 1): 4}
+    ]
+    assert mock_kafka_consumer.commit.call_args.kwargs["asynchronous"] is False
+    assert order_consumer.messages_processed == 4
+
+
+@pytest.mark.unit
+def test_commit_keeps_highest_offset_per_partition(
+    order_consumer, mock_kafka_consumer, order_value
+):
+    """Test an out-of-order (redelivered) offset never moves the commit backwards."""
+    for offset in [5, 7, 6]:
+        order_consumer._process_message(make_message(order_value, offset))
+
+    order_consumer._flush_batch(asynchronous=False)
+
+    assert committed_offsets(mock_kafka_consumer) == [{("food-orders", 0): 8}]
+
+
+@pytest.mark.unit
+def test_async_flush_commits_only_when_write_completes(
+    order_consumer, mock_kafka_consumer, order_value
+):
+    """Test the hot path defers the commit until the in-flight write is done."""
+    order_consumer._process_message(make_message(order_value, 10))
+
+    order_consumer._flush_batch(asynchronous=True)
+    order_consumer._inflight.future.result()  # Let the writer thread finish
+    mock_kafka_consumer.commit.assert_not_called()
+
+    order_consumer._maybe_flush()
+
+    assert committed_offsets(mock_kafka_consumer) == [{("food-orders", 0): 11}]
+    assert mock_kafka_consumer.commit.call_args.kwargs["asynchronous"] is True
+
+
+@pytest.mark.unit
+def test_failed_write_drops_pending_state_without_commit(
+    order_consumer, mock_kafka_consumer, db_writer, order_value
+):
+    """Test a failed write re-raises, commits nothing and forgets pending offsets."""
+    db_writer.side_effect = OperationalError("INSERT", {}, Exception("down"))
+    order_consumer._process_message(make_message(order_value, 1))
+    order_consumer._flush_batch(asynchronous=True)
+
+    # Arrives while the failing batch is in flight
+    order_consumer._process_message(make_message(order_value, 2))
+
+    with pytest.raises(OperationalError):
+        order_consumer._flush_batch(asynchronous=False)
+
+    mock_kafka_consumer.commit.assert_not_called()
+    assert order_consumer._pending_offsets == {}
+    assert order_consumer._uncommitted_count == 0
+    assert order_consumer._inflight is None
+
+
+@pytest.mark.unit
+def test_revoke_flushes_synchronously(order_consumer, mock_kafka_consumer, db_writer, order_value):
+    """Test partition revocation writes the batch and commits before returning."""
+    order_consumer._process_message(make_message(order_value, 41, partition=2))
+
+    order_consumer._on_revoke(mock_kafka_consumer, [MagicMock(partition=2)])
+
+    db_writer.assert_called_once()
+    assert order_consumer._inflight is None
+    assert committed_offsets(mock_kafka_consumer) == [{("food-orders", 2): 42}]
+    assert mock_kafka_consumer.commit.call_args.kwargs["asynchronous"] is False
+
+
+# ==============================================================================
+# BAD ROW TESTS
+# ==============================================================================
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("error", [IntegrityError, DataError])
+def test_bad_row_is_isolated_and_skipped(order_consumer, db_manager, sample_order_data, error):
+    """Test a row the database rejects is skipped; the rest of the batch is written."""
+    rows = [
+        Order.row_from_kafka_message(dict(sample_order_data, order_id=f"ORD-{i}")) for i in range(5)
+    ]
+
+    def bulk_copy_orders(batch):
+        if any(row["order_id"] == "ORD-3" for row in batch):
+            raise error("INSERT", {}, Exception("rejected"))
+        return len(batch)
+
+    db_manager.bulk_copy_orders.side_effect = bulk_copy_orders
+
+    assert order_consumer._write_rows(rows) == _WriteResult(inserted=4, rejected=1)
+    # Halved down to the bad row alone, which is tried exactly once
+    batches = [
+        [row["order_id"] for row in c.args[0]] for c in db_manager.bulk_copy_orders.call_args_list
+    ]
+    assert batches.count(["ORD-3"]) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("amount", [0.004, 1e300])
+def test_amount_outside_cents_range_is_skipped(order_consumer, db_manager, order_value, amount):
+    """Test an amount that doesn't convert to 0 < cents < 2**63 is skipped before the DB."""
+    # Exercise the real writer instead of the fixture's stub
+    del order_consumer._write_batch_with_retry
+    good = consumer_module._decode_order(order_value)
+    # Constructed directly: bypasses the decoder's bounds
+    bad = msgspec.structs.replace(good, order_id="ORD-BAD", total_amount=amount)
+
+    assert order_consumer._write_batch_with_retry([bad, good]) == _WriteResult(1, 1)
+    (rows,) = db_manager.bulk_copy_orders.call_args.args
+    assert [row["order_id"] for row in rows] == [good.order_id]
+
+    assert order_consumer._write_batch_with_retry([bad]) == _WriteResult(0, 1)
+    assert db_manager.bulk_copy_orders.call_count == 1
+
+
+@pytest.mark.unit
+def test_transient_error_is_not_split(order_consumer, db_manager, sample_order_data):
+    """Test an OperationalError fails the batch instead of skipping rows."""
+    db_manager.bulk_copy_orders.side_effect = OperationalError("COPY", {}, Exception("down"))
+    order_consumer._max_retries = 1
+    rows = [Order.row_from_kafka_message(sample_order_data)] * 2
+
+    with pytest.raises(OperationalError):
+        order_consumer._write_rows(rows)
+    assert db_manager.bulk_copy_orders.call_count == 1
+
+
+@pytest.mark.unit
+def test_rejected_rows_counted_as_failed_and_committed(
+    order_consumer, mock_kafka_consumer, db_writer, order_value
+):
+    """Test rejected rows are counted as failed and their offsets still committed."""
+    db_writer.side_effect = lambda batch: _WriteResult(len(batch) - 1, 1)
+    for offset in [0, 1]:
+        order_consumer._process_message(make_message(order_value, offset))
+
+    order_consumer._flush_batch(asynchronous=False)
+
+    assert order_consumer.messages_processed == 1
+    assert order_consumer.messages_failed == 1
+    assert order_consumer.messages_skipped == 0
+    assert committed_offsets(mock_kafka_consumer) == [{("food-orders", 0): 2}]
+
+
+# ==============================================================================
+# POISON MESSAGE TESTS
+# ==============================================================================
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value",
+    [
+        b"{not json",  # msgspec.DecodeError
+        b"",  # Null value (tombstone) - DecodeError path
+        orjson.dumps({"order_id": "ORD-20250110-00001"}),  # msgspec.ValidationError
+    ],
+    ids=["decode_error", "empty_value", "validation_error"],
+)
+def test_poison_message_is_skipped(order_consumer, mock_kafka_consumer, db_writer, value):
+    """Test an undecodable or invalid message is counted, skipped and committed."""
+    order_consumer._process_message(make_message(value, 9))
+
+    assert order_consumer.messages_failed == 1
+    assert order_consumer._pending_offsets == {("food-orders", 0): 10}
+
+    order_consumer._flush_batch(asynchronous=False)
+
+    db_writer.assert_not_called()
+    assert committed_offsets(mock_kafka_consumer) == [{("food-orders", 0): 10}]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("total_amount", "21.47"),  # String, not a JSON number
+        ("total_amount", True),
+        ("total_amount", 0),
+        ("items", []),
+        ("created_at", "yesterday"),
+        ("total_amount", 0.004),  # Rounds to 0 cents (check_positive_amount)
+        ("total_amount", 0.005),  # Rounds half-even to 0 cents
+        ("total_amount", 1e300),  # Doesn't fit BIGINT cents
+        ("order_id", "O" * 51),  # VARCHAR(50)
+        ("customer_id", "C" * 80),  # VARCHAR(50)
+        ("customer_name", "N" * 101),  # VARCHAR(100)
+        ("customer_email", "e" * 95 + "@x.com"),  # VARCHAR(100)
+        ("status", "s" * 21),  # VARCHAR(20)
+    ],
+)
+def test_invalid_field_fails_validation(order_consumer, sample_order_data, field, value):
+    """Test schema violations are rejected by the decoder, not buffered."""
+    msg = make_message(orjson.dumps(dict(sample_order_data, **{field: value})), 3)
+
+    order_consumer._process_message(msg)
+
+    assert order_consumer.messages_failed == 1
+    assert order_consumer._pending_orders == []
+
+
+@pytest.mark.unit
+def test_total_amount_bounds_match_cents_column(order_consumer, sample_order_data):
+    """Test the decoder accepts exactly the amounts with 0 < cents < 2**63."""
+    smallest = math.nextafter(consumer_module._MIN_AMOUNT_EXCLUSIVE, math.inf)
+    largest = math.nextafter(consumer_module._MAX_AMOUNT_EXCLUSIVE, 0)
+    assert amount_to_cents(consumer_module._MIN_AMOUNT_EXCLUSIVE) == 0
+    assert amount_to_cents(smallest) == 1
+    assert amount_to_cents(largest) < 2**63
+
+    for offset, amount in enumerate([smallest, largest]):
+        msg = make_message(orjson.dumps(dict(sample_order_data, total_amount=amount)), offset)
+        order_consumer._process_message(msg)
+
+    assert order_consumer.messages_failed == 0
+    assert len(order_consumer._pending_orders) == 2
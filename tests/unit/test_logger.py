@@ -0,0 +1,45 @@
+"""
+Unit Tests for Structured Logging
+
+Tests the JSONFormatter used by the producer and consumer services.
+
+TEST STRATEGY:
+- Test extra fields are included, private (_) attributes are not
+- Test unusual extra keys never make formatting raise
+"""
+
+import logging
+
+import orjson
+import pytest
+
+from src.shared.logger import JSONFormatter
+
+
+def make_record(**extra):
+    """Build a LogRecord carrying the given extra attributes."""
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "hello", None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.mark.unit
+def test_json_formatter_includes_extra_fields():
+    """Test extra fields land under "extra"; underscore attributes are skipped."""
+    formatter = JSONFormatter(service_name="test-service")
+
+    log = orjson.loads(formatter.format(make_record(customer_id="CUST-00001", _private=1)))
+
+    assert log["message"] == "hello"
+    assert log["service"] == "test-service"
+    assert log["extra"] == {"customer_id": "CUST-00001"}
+
+
+@pytest.mark.unit
+def test_json_formatter_empty_extra_key():
+    """Test an empty-string extra key is formatted instead of raising."""
+    formatter = JSONFormatter(service_name="test-service")
+
+    log = orjson.loads(formatter.format(make_record(**{"": "value"})))
+
+    assert log["extra"] == {"": "value"}
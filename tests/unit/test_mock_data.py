@@ -11,7 +11,7 @@ TEST STRATEGY:
 - Test edge cases (min/max quantities, unique IDs)
 """
 
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 
 import pytest
 
@@ -62,6 +62,23 @@ def test_different_seeds_produce_different_data():
     assert customers1[0]["name"] != customers2[0]["name"]
 
 
+@pytest.mark.unit
+def test_seeded_orders_independent_of_global_random():
+    """Test that order randomness comes from the generator's own RNG."""
+    import random
+
+    gen1 = MockDataGenerator(seed=42)
+    random.seed(1)
+    gen2 = MockDataGenerator(seed=42)
+    random.random()  # Advancing the global RNG must not change gen2's orders
+
+    for _ in range(20):
+        order1 = gen1.generate_order()
+        order2 = gen2.generate_order()
+        assert order1["customer_id"] == order2["customer_id"]
+        assert order1["items"] == order2["items"]
+
+
 # ==============================================================================
 # CUSTOMER GENERATION TESTS
 # ==============================================================================
@@ -144,6 +161,21 @@ def test_menu_item_data_structure():
     assert item["price"] < 100  # Reasonable max price
 
 
+@pytest.mark.unit
+def test_menu_item_prices_in_integer_cents():
+    """Test that prices carry exact integer cents and subtotals use them."""
+    generator = MockDataGenerator(seed=42)
+
+    for item in generator.menu_items:
+        assert isinstance(item["price_cents"], int)
+        assert item["price_cents"] / 100 == item["price"]
+
+    for _ in range(20):
+        for item in generator.get_random_menu_items(1, 5):
+            price_cents = round(item["price"] * 100)
+            assert item["subtotal"] == price_cents * item["quantity"] / 100
+
+
 @pytest.mark.unit
 def test_menu_item_ids_unique():
     """Test that all menu item IDs are unique."""
@@ -256,6 +288,26 @@ def test_order_item_structure():
         assert item["subtotal"] == round(item["quantity"] * item["price"], 2)
 
 
+@pytest.mark.unit
+def test_order_items_match_menu_and_customer_pool():
+    """Test that orders built from the flat arrays match the dict pools."""
+    generator = MockDataGenerator(seed=42)
+    menu = {m["item_id"]: m for m in generator.menu_items}
+    customers = {c["customer_id"]: c for c in generator.customers}
+
+    for _ in range(50):
+        order = generator.generate_order()
+        customer = customers[order["customer_id"]]
+        assert order["customer_name"] == customer["name"]
+        assert order["customer_email"] == customer["email"]
+
+        item_ids = [item["item_id"] for item in order["items"]]
+        assert len(item_ids) == len(set(item_ids))  # No duplicate items
+        for item in order["items"]:
+            assert item["name"] == menu[item["item_id"]]["name"]
+            assert item["price"] == menu[item["item_id"]]["price"]
+
+
 @pytest.mark.unit
 def test_order_total_amount_calculation():
     """Test that order total is correctly calculated."""
@@ -306,6 +358,24 @@ def test_order_timestamp_format():
         pytest.fail(f"Invalid timestamp format: {order['created_at']}")
 
 
+@pytest.mark.unit
+def test_order_timestamp_is_current_utc_with_milliseconds():
+    """Test that the cached-second formatter yields the current UTC time."""
+    generator = MockDataGenerator(seed=42)
+
+    before = datetime.now(UTC)
+    created_at = [generator.generate_order()["created_at"] for _ in range(3)]
+    after = datetime.now(UTC)
+
+    for timestamp_str in created_at:
+        # YYYY-MM-DDTHH:MM:SS.mmmZ
+        assert len(timestamp_str) == 24
+        assert timestamp_str[19] == "." and timestamp_str.endswith("Z")
+        parsed = datetime.fromisoformat(timestamp_str[:-1] + "+00:00")
+        # Truncated to milliseconds, so may be up to 1 ms before `before`
+        assert before - timedelta(milliseconds=1) <= parsed <= after
+
+
 # ==============================================================================
 # EDGE CASES AND CONSTRAINTS
 # ==============================================================================
@@ -369,6 +439,21 @@ def test_order_sequence_counter():
     assert seq2 > seq1 or seq1 == 99999  # Handle rollover
 
 
+@pytest.mark.unit
+def test_order_id_date_prefix_refreshed_after_midnight():
+    """Test that the cached order ID date is recomputed once it expires."""
+    generator = MockDataGenerator(seed=42)
+    generator.generate_order_id()
+
+    # Simulate a prefix cached yesterday whose validity has run out
+    generator._order_id_prefix = "ORD-19990101-"
+    generator._order_id_valid_until = 0.0
+
+    order_id = generator.generate_order_id()
+    assert order_id.split("-")[1] == datetime.now().strftime("%Y%m%d")
+    assert generator._order_id_valid_until > datetime.now().timestamp()
+
+
 # ==============================================================================
 # DATA QUALITY TESTS
 # ==============================================================================
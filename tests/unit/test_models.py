@@ -12,10 +12,12 @@ TEST STRATEGY:
 - Test string representations
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
+from unittest.mock import MagicMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from src.consumer.models import Order
 
@@ -39,6 +41,73 @@ def test_order_from_kafka_message(sample_order_data):
     assert isinstance(order.created_at, datetime)
 
 
+@pytest.mark.unit
+def test_order_row_from_kafka_message(sample_order_data):
+    """Test building a plain column dict for batched Core inserts."""
+    row = Order.row_from_kafka_message(sample_order_data)
+
+    assert set(row) == {c.name for c in Order.__table__.columns} - {"processed_at"}
+    assert row["order_id"] == sample_order_data["order_id"]
+    assert row["total_amount_cents"] == round(sample_order_data["total_amount"] * 100)
+    assert isinstance(row["created_at"], datetime)
+
+
+@pytest.mark.unit
+def test_order_bulk_upsert_deduplicates_by_order_id(sample_order_data):
+    """Test bulk_upsert sends each order_id once (last row wins)."""
+    first = Order.row_from_kafka_message(sample_order_data)
+    second = dict(first, status="completed")
+    session = MagicMock()
+
+    count = Order.bulk_upsert(session, [first, second])
+
+    assert count == 1
+    sent_rows = session.execute.call_args[0][1]
+    assert sent_rows == [second]
+    assert Order.bulk_upsert(session, []) == 0
+
+
+@pytest.mark.unit
+def test_order_insert_new_counts_returned_rows(sample_order_data):
+    """Test insert_new returns the number of rows RETURNING reported."""
+    row = Order.row_from_kafka_message(sample_order_data)
+    session = MagicMock()
+    session.execute.return_value.all.return_value = [(row["order_id"],)]
+
+    assert Order.insert_new(session, [row, row]) == 1
+    stmt = session.execute.call_args[0][0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (order_id, created_at) DO NOTHING" in sql
+    assert Order.insert_new(session, []) == 0
+
+
+@pytest.mark.unit
+def test_order_create_partitions_current_and_next_month(monkeypatch):
+    """Test create_partitions() asks for this month and next (across a year end)."""
+
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2025, 12, 15, 12, 0, tzinfo=tz)
+
+    monkeypatch.setattr("src.consumer.models.datetime", FixedDatetime)
+    session = MagicMock()
+
+    assert Order.create_partitions(session) == ["orders_2025_12", "orders_2026_01"]
+    days = [c[0][1]["day"] for c in session.execute.call_args_list]
+    assert days == [date(2025, 12, 1), date(2026, 1, 1)]
+
+
+@pytest.mark.unit
+def test_order_items_contains_uses_containment():
+    """Test items_contains() compiles to a GIN-indexable @> filter."""
+    expr = Order.items_contains("name", "Burger")
+    compiled = expr.compile(dialect=postgresql.dialect())
+
+    assert "@>" in str(compiled)
+    assert list(compiled.params.values()) == [[{"name": "Burger"}]]
+
+
 @pytest.mark.unit
 def test_order_timestamp_parsing_with_z_suffix():
     """Test timestamp parsing with Z suffix (UTC)."""
@@ -90,6 +159,7 @@ def test_order_total_amount_decimal_conversion():
     }
 
     order = Order.from_kafka_message(data)
+    assert order.total_amount_cents == 1099
     assert isinstance(order.total_amount, Decimal)
     assert float(order.total_amount) == 10.99
 
@@ -163,6 +233,18 @@ def test_order_repr(sample_order_data):
     assert sample_order_data["customer_id"] in repr_str
 
 
+@pytest.mark.unit
+def test_order_repr_does_not_load_expired_attributes(sample_order_data):
+    """Test __repr__ only reads loaded values (no refresh on expired rows)."""
+    order = Order.from_kafka_message(sample_order_data)
+    del order.__dict__["status"]  # As after session.expire()/commit()
+
+    repr_str = repr(order)
+
+    assert "status=None" in repr_str
+    assert "total_amount=" + str(order.total_amount) in repr_str
+
+
 @pytest.mark.unit
 def test_order_str(sample_order_data):
     """Test Order __str__ method."""
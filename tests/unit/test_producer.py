@@ -0,0 +1,189 @@
+"""
+Unit Tests for Order Producer
+
+Tests OrderProducer against a mocked confluent_kafka.Producer.
+These are unit tests that don't require a Kafka broker.
+
+TEST STRATEGY:
+- Test the produce_orders() return count (orders handed to librdkafka)
+- Test backpressure handling (BufferError retry, then drop)
+- Test the background poll thread serves delivery reports
+- Test graceful shutdown of the background poll thread
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+from confluent_kafka import KafkaException
+
+from src.producer import producer as producer_module
+from src.producer.producer import OrderProducer
+
+
+def wait_for(condition, timeout=2.0):
+    """Poll condition() until it is true or timeout seconds have passed."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+
+@pytest.fixture
+def mock_kafka_producer(monkeypatch):
+    """Replace confluent_kafka.Producer with a MagicMock; returns the instance."""
+    kafka_producer = MagicMock()
+    kafka_producer.flush.return_value = 0
+    # poll() blocks for its timeout, like librdkafka with no events queued
+    kafka_producer.poll.side_effect = lambda timeout: time.sleep(timeout) or 0
+    monkeypatch.setattr(producer_module, "Producer", MagicMock(return_value=kafka_producer))
+    # Keep the poll thread responsive and buffer-full retries fast
+    monkeypatch.setattr(producer_module, "_POLL_TIMEOUT_S", 0.01)
+    monkeypatch.setattr(producer_module, "_BUFFER_FULL_WAIT_S", 0.0)
+    return kafka_producer
+
+
+@pytest.fixture
+def order_producer(mock_kafka_producer):
+    """OrderProducer wired to the mocked Kafka client, closed after the test."""
+    producer = OrderProducer("localhost:9092", "food-orders", log_level="CRITICAL")
+    yield producer
+    producer.close(timeout=0)
+
+
+# ==============================================================================
+# PRODUCE_ORDERS TESTS
+# ==============================================================================
+
+
+@pytest.mark.unit
+def test_produce_orders_returns_count(order_producer, mock_kafka_producer, sample_order_data):
+    """Test every valid order is produced, keyed by customer_id."""
+    orders = [sample_order_data, dict(sample_order_data, order_id="ORD-20250110-00002")]
+
+    assert order_producer.produce_orders(orders) == 2
+
+    assert mock_kafka_producer.produce.call_count == 2
+    args, kwargs = mock_kafka_producer.produce.call_args
+    assert args == ("food-orders", orjson.dumps(orders[1]), sample_order_data["customer_id"])
+    assert kwargs == {"on_delivery": order_producer.delivery_callback}
+
+
+@pytest.mark.unit
+def test_produce_orders_skips_order_missing_customer_id(
+    order_producer, mock_kafka_producer, sample_order_data
+):
+    """Test an order without customer_id is skipped and not counted."""
+    invalid = {k: v for k, v in sample_order_data.items() if k != "customer_id"}
+
+    assert order_producer.produce_orders([invalid, sample_order_data]) == 1
+    assert mock_kafka_producer.produce.call_count == 1
+
+
+@pytest.mark.unit
+def test_produce_orders_skips_order_on_kafka_error(
+    order_producer, mock_kafka_producer, sample_order_data
+):
+    """Test a client error fails only that order; the batch continues."""
+    mock_kafka_producer.produce.side_effect = [KafkaException("boom"), None]
+
+    assert order_producer.produce_orders([sample_order_data, sample_order_data]) == 1
+
+
+@pytest.mark.unit
+def test_produce_orders_retries_once_on_buffer_error(
+    order_producer, mock_kafka_producer, sample_order_data
+):
+    """Test a full queue is retried once, polling only from the poll thread."""
+    poll_threads = set()
+
+    def poll(timeout):
+        poll_threads.add(threading.current_thread().name)
+        time.sleep(timeout)
+        return 0
+
+    mock_kafka_producer.poll.side_effect = poll
+    mock_kafka_producer.produce.side_effect = [BufferError("Queue full"), None]
+
+    assert order_producer.produce_orders([sample_order_data]) == 1
+    assert mock_kafka_producer.produce.call_count == 2
+    assert poll_threads <= {"kafka-producer-poll"}
+
+
+@pytest.mark.unit
+def test_produce_orders_buffer_full_waits_for_deliveries(
+    order_producer, mock_kafka_producer, monkeypatch, sample_order_data
+):
+    """Test the retry happens as soon as the poll thread has served deliveries."""
+    monkeypatch.setattr(producer_module, "_BUFFER_FULL_WAIT_S", 10.0)
+    # Every poll serves one delivery report
+    mock_kafka_producer.poll.side_effect = lambda timeout: time.sleep(timeout) or 1
+    mock_kafka_producer.produce.side_effect = [BufferError("Queue full"), None]
+
+    start = time.monotonic()
+    assert order_producer.produce_orders([sample_order_data]) == 1
+    assert time.monotonic() - start < 1.0
+
+
+@pytest.mark.unit
+def test_produce_orders_drops_order_when_buffer_stays_full(
+    order_producer, mock_kafka_producer, sample_order_data
+):
+    """Test an order still rejected after the retry is dropped and not counted."""
+    mock_kafka_producer.produce.side_effect = [
+        BufferError("Queue full"),
+        BufferError("Queue full"),
+        None,
+    ]
+
+    assert order_producer.produce_orders([sample_order_data, sample_order_data]) == 1
+    assert mock_kafka_producer.produce.call_count == 3
+
+
+# ==============================================================================
+# POLL THREAD TESTS
+# ==============================================================================
+
+
+@pytest.mark.unit
+def test_poll_thread_serves_delivery_reports(order_producer, mock_kafka_producer):
+    """Test delivery reports are polled in the background, not by the caller."""
+    assert order_producer._poll_thread.is_alive()
+    assert wait_for(lambda: mock_kafka_producer.poll.call_count >= 2)
+    mock_kafka_producer.poll.assert_called_with(producer_module._POLL_TIMEOUT_S)
+
+
+@pytest.mark.unit
+def test_poll_thread_survives_callback_error(order_producer, mock_kafka_producer):
+    """Test an exception raised by a delivery callback doesn't stop the thread."""
+    errors = iter([RuntimeError("callback failed")])
+
+    def poll(timeout):
+        error = next(errors, None)
+        if error is not None:
+            raise error
+        time.sleep(timeout)
+        return 0
+
+    mock_kafka_producer.poll.side_effect = poll
+    calls = mock_kafka_producer.poll.call_count
+
+    assert wait_for(lambda: mock_kafka_producer.poll.call_count >= calls + 3)
+    assert order_producer._poll_thread.is_alive()
+
+
+@pytest.mark.unit
+def test_close_flushes_and_stops_poll_thread(mock_kafka_producer):
+    """Test close() flushes pending messages and joins the poll thread."""
+    producer = OrderProducer("localhost:9092", "food-orders", log_level="CRITICAL")
+    assert producer._poll_thread.is_alive()
+
+    producer.close(timeout=1.0)
+
+    mock_kafka_producer.flush.assert_called()
+    assert producer._poll_stop.is_set()
+    assert not producer._poll_thread.is_alive()